@@ -1,92 +1,149 @@
 """Analyze SafiPrint.rpt for misaligned headers/objects."""
-from collections import defaultdict
+import functools
+import itertools
+import statistics
+import sys
 from crystalreports import CrystalReport
 
 AREA_NAMES = {
     1: "Report Header", 2: "Page Header", 3: "Group Header",
     4: "Detail", 5: "Group Footer", 6: "Report Footer", 7: "Page Footer",
 }
+TOLERANCE = 20  # twips (~0.35mm)
+
+
+@functools.lru_cache(maxsize=None)
+def _section_label(code):
+    """Return ``(label, area, sub)`` for a section code."""
+    area = code // 6000
+    sub = (code - area * 6000) // 50
+    label = AREA_NAMES.get(area, "?") + (f" #{sub}" if sub > 0 else "")
+    return label, area, sub
+
+
+def _cluster_rows(tops):
+    """Group sorted ``top`` values into rows of approximately equal height.
+
+    *tops* must already be sorted; a single linear scan starts a new row
+    wherever the gap to the previous value exceeds TOLERANCE.  Returns
+    the rows as index ranges into *tops*, keeping only rows with more
+    than one object.
+    """
+    rows = []
+    start = 0
+    for i in range(1, len(tops)):
+        if tops[i] - tops[i - 1] > TOLERANCE:
+            if i - start > 1:
+                rows.append(range(start, i))
+            start = i
+    if len(tops) - start > 1:
+        rows.append(range(start, len(tops)))
+    return rows
+
+
+def _analyze(tops, bottoms):
+    """Find misaligned objects in one section's coordinate columns.
+
+    Operates on plain ints only.  *tops* must be sorted.  Returns
+    ``(rows, misaligned, issues)``: the row index ranges from
+    :func:`_cluster_rows`, ``(index, edge, value, diff, expected)``
+    records and ``(row, min_top, max_top)`` for every row whose tops
+    differ.
+    """
+    rows = _cluster_rows(tops)
+    misaligned = []
+    issues = []
+    median_low = statistics.median_low
+    for row in rows:
+        row_tops = tops[row.start:row.stop]
+        row_bottoms = bottoms[row.start:row.stop]
+        # Compare against the row median so a single outlier cannot
+        # drag the reference value and mask the real misalignment.
+        if row_tops[0] != row_tops[-1]:  # tops are sorted within the row
+            # Objects on same row have different top values
+            median_top = median_low(row_tops)
+            for i, top in zip(row, row_tops):
+                if top != median_top:
+                    misaligned.append(
+                        (i, "top", top, top - median_top, median_top))
+            issues.append((row, row_tops[0], row_tops[-1]))
+        median_bottom = median_low(row_bottoms)
+        for i, bottom in zip(row, row_bottoms):
+            diff = bottom - median_bottom
+            if abs(diff) > TOLERANCE:
+                misaligned.append((i, "bottom", bottom, diff, median_bottom))
+    return rows, misaligned, issues
+
 
 with CrystalReport("SafiPrint.rpt") as rpt:
     print(f"Report: {rpt}")
     print(f"Margins (L,R,T,B): {rpt.get_margins()}")
     print()
 
-    # Group objects by section
-    sections = defaultdict(list)
-    for obj in rpt.objects:
-        sections[obj.section_code].append(obj)
-
-    # Analyze each section
-    for code in sorted(sections.keys()):
-        area = code // 6000
-        sub = (code - area * 6000) // 50
-        area_name = AREA_NAMES.get(area, "?")
-        label = f"{area_name}" + (f" #{sub}" if sub > 0 else "")
-        objects = sections[code]
+    # Read the layout as parallel columns and sort the indices once by
+    # (section, top, left); no per-object records are built.
+    soa = rpt.get_objects_soa()
+    names = soa["name"]
+    types = soa["object_type"]
+    codes = soa["section_code"]
+    lefts, tops_all = soa["left"], soa["top"]
+    rights, bottoms_all = soa["right"], soa["bottom"]
+    order = sorted(range(len(codes)),
+                   key=lambda i: (codes[i], tops_all[i], lefts[i]))
+
+    # Analyze each section once; both the detail and summary passes read
+    # from this cache.
+    section_cache = {}
+    for code, group in itertools.groupby(order, key=codes.__getitem__):
+        indices = list(group)
+        # Column views of the coordinates used by the analysis
+        tops = [tops_all[i] for i in indices]
+        bottoms = [bottoms_all[i] for i in indices]
+
+        rows, found, issue_rows = _analyze(tops, bottoms)
+        misaligned = [(names[indices[i]], edge, value, diff, expected)
+                      for i, edge, value, diff, expected in found]
+        issues = [(min_t, max_t, [names[indices[i]] for i in row])
+                  for row, min_t, max_t in issue_rows]
+
+        section_cache[code] = {
+            "indices": indices,
+            "rows": rows,
+            "misaligned": misaligned,
+            "issues": issues,
+        }
+
+    # Print each section
+    for code, entry in section_cache.items():
+        label, area, sub = _section_label(code)
+        indices = entry["indices"]
         height = rpt.get_section_height(code)
 
         print(f"{'='*70}")
-        print(f"Section {code} — {label} (height={height}, {len(objects)} objects)")
+        print(f"Section {code} — {label} (height={height}, {len(indices)} objects)")
         print(f"{'='*70}")
 
-        if not objects:
+        if not indices:
             continue
 
-        # Print all objects sorted by left position
-        objects_sorted = sorted(objects, key=lambda o: (o.top, o.left))
-        for obj in objects_sorted:
-            w = obj.right - obj.left
-            h = obj.bottom - obj.top
-            # Note: bottom < top means the object uses inverted coords (height)
-            print(f"  {obj.name:35s} {obj.object_type:8s} "
-                  f"L={obj.left:5d} T={obj.top:5d} R={obj.right:5d} B={obj.bottom:5d} "
-                  f"(w={w:5d} h={obj.bottom - obj.top:5d})")
-
-        # --- Alignment analysis ---
-        # Group objects by approximate top position (within 20 twips tolerance)
-        TOLERANCE = 20  # twips (~0.35mm)
-        rows = []
-        used = set()
-        for obj in objects_sorted:
-            if id(obj) in used:
-                continue
-            row = [obj]
-            used.add(id(obj))
-            for other in objects_sorted:
-                if id(other) in used:
-                    continue
-                if abs(other.top - obj.top) <= TOLERANCE:
-                    row.append(other)
-                    used.add(id(other))
-            if len(row) > 1:
-                rows.append(row)
-
-        # Check each row for misalignment
-        misaligned = []
-        for row in rows:
-            tops = [o.top for o in row]
-            bottoms = [o.bottom for o in row]
-            if len(set(tops)) > 1:
-                # Objects on same row have different top values
-                avg_top = sum(tops) // len(tops)
-                for obj in row:
-                    if obj.top != avg_top:
-                        diff = obj.top - avg_top
-                        misaligned.append((obj, "top", diff, avg_top))
-            if len(set(bottoms)) > 1:
-                avg_bottom = sum(bottoms) // len(bottoms)
-                for obj in row:
-                    if abs(obj.bottom - avg_bottom) > TOLERANCE:
-                        diff = obj.bottom - avg_bottom
-                        misaligned.append((obj, "bottom", diff, avg_bottom))
-
+        # Print all objects sorted by top, then left position, in one write.
+        # Note: bottom < top means the object uses inverted coords (height)
+        lines = [
+            f"  {names[i]:35s} {types[i]:8s} "
+            f"L={lefts[i]:5d} T={tops_all[i]:5d} R={rights[i]:5d} B={bottoms_all[i]:5d} "
+            f"(w={rights[i] - lefts[i]:5d} h={bottoms_all[i] - tops_all[i]:5d})"
+            for i in indices
+        ]
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+
+        misaligned = entry["misaligned"]
         if misaligned:
             print()
             print(f"  *** MISALIGNED OBJECTS:")
-            for obj, edge, diff, expected in misaligned:
+            for name, edge, value, diff, expected in misaligned:
                 direction = "te laag" if diff > 0 else "te hoog"
-                print(f"      {obj.name:30s} {edge}={getattr(obj, edge):5d} "
+                print(f"      {name:30s} {edge}={value:5d} "
                       f"(verwacht ~{expected}, {direction} met {abs(diff)} twips)")
         print()
 
@@ -96,48 +153,17 @@ with CrystalReport("SafiPrint.rpt") as rpt:
     print(f"{'='*70}")
 
     total_issues = 0
-    for code in sorted(sections.keys()):
-        area = code // 6000
-        sub = (code - area * 6000) // 50
-        area_name = AREA_NAMES.get(area, "?")
-        label = f"{area_name}" + (f" #{sub}" if sub > 0 else "")
-        objects = sections[code]
-        if len(objects) < 2:
+    for code, entry in section_cache.items():
+        issues = entry["issues"]
+        if not issues:
             continue
+        label, area, sub = _section_label(code)
 
-        objects_sorted = sorted(objects, key=lambda o: (o.top, o.left))
-        rows = []
-        used = set()
-        for obj in objects_sorted:
-            if id(obj) in used:
-                continue
-            row = [obj]
-            used.add(id(obj))
-            for other in objects_sorted:
-                if id(other) in used:
-                    continue
-                if abs(other.top - obj.top) <= TOLERANCE:
-                    row.append(other)
-                    used.add(id(other))
-            if len(row) > 1:
-                rows.append(row)
-
-        section_issues = []
-        for row in rows:
-            tops = [o.top for o in row]
-            if len(set(tops)) > 1:
-                names = [o.name for o in row]
-                min_t, max_t = min(tops), max(tops)
-                section_issues.append(
-                    f"    Rij (top~{min_t}): {', '.join(names)} — "
-                    f"verschil {max_t - min_t} twips"
-                )
-
-        if section_issues:
-            print(f"\n  {label} (section {code}):")
-            for issue in section_issues:
-                print(issue)
-                total_issues += 1
+        print(f"\n  {label} (section {code}):")
+        for min_t, max_t, row_names in issues:
+            print(f"    Rij (top~{min_t}): {', '.join(row_names)} — "
+                  f"verschil {max_t - min_t} twips")
+        total_issues += len(issues)
 
     if total_issues == 0:
         print("\n  Alles staat recht!")
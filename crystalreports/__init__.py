@@ -14,12 +14,12 @@ from .models import (
     ParameterInfo,
     ReportMetadata,
     ReportObject,
+    ReportSchema,
     SectionInfo,
     SortFieldInfo,
     SubreportInfo,
     TableInfo,
 )
-from .ole_parser import OleParser
 from .report import CrystalReport
 
 try:
@@ -31,6 +31,16 @@ except Exception:
 
 __version__ = "0.1.0"
 
+
+def __getattr__(name: str):
+    # OleParser pulls in olefile; load it only when first used
+    if name == "OleParser":
+        from .ole_parser import OleParser
+        globals()["OleParser"] = OleParser
+        return OleParser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Main class
     "CrystalReport",
@@ -46,6 +56,7 @@ __all__ = [
     "SubreportInfo",
     "SortFieldInfo",
     "ReportObject",
+    "ReportSchema",
     "ExportFormat",
     # Helpers
     "rgb_to_colorref",
@@ -10,12 +10,15 @@ functions will raise :class:`~.exceptions.SDKNotAvailableError`.
 
 from __future__ import annotations
 
+import array
+import concurrent.futures
 import ctypes
 import ctypes.wintypes as wt
+import functools
 import os
-import struct as _struct
+import threading
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 from .exceptions import (
     CrystalReportsError,
@@ -28,70 +31,82 @@ from .models import (
     FormulaInfo,
     ParameterInfo,
     ReportObject,
+    ReportSchema,
     SectionInfo,
     SortFieldInfo,
     TableInfo,
 )
+from .profiling import profile_function
 
 # ------------------------------------------------------------------
 # DLL discovery
 # ------------------------------------------------------------------
 
-_DEFAULT_DLL_PATHS = [
+_DEFAULT_DLL_PATHS = (
     r"C:\Program Files (x86)\SAP BusinessObjects\SAP BusinessObjects Enterprise XI 4.0\win64_x64\crpe32.dll",
     r"C:\Program Files (x86)\SAP BusinessObjects\Crystal Reports for .NET Framework 4.0\Common\SAP BusinessObjects Enterprise XI 4.0\win64_x64\crpe32.dll",
     r"C:\Program Files\SAP BusinessObjects\SAP BusinessObjects Enterprise XI 4.0\win64_x64\crpe32.dll",
-]
+)
 
-_dll: Optional[ctypes.WinDLL] = None
+_dll: Optional[_LazyDLL] = None
 _dll_path: Optional[str] = None
+_sdk_available: Optional[bool] = None
+_dll_error: Optional[str] = None  # why loading failed, once it has
 
 
+@functools.lru_cache(maxsize=1)
 def _find_dll() -> Optional[str]:
-    """Locate crpe32.dll on the system."""
+    """Locate crpe32.dll on the system.
+
+    The result is cached for the lifetime of the process.
+    """
     env_path = os.environ.get("CRPE32_DLL_PATH")
-    if env_path and Path(env_path).exists():
-        return env_path
-    for p in _DEFAULT_DLL_PATHS:
-        if Path(p).exists():
-            return p
-    return None
+    candidates = ((env_path,) if env_path else ()) + _DEFAULT_DLL_PATHS
+    return next((p for p in candidates if os.path.isfile(p)), None)
+
 
+def _load_dll() -> _LazyDLL:
+    """Load crpe32.dll, caching the result.
 
-def _load_dll() -> ctypes.WinDLL:
-    """Load crpe32.dll, caching the result."""
-    global _dll, _dll_path
+    A failure is cached as well: later calls raise the same
+    :class:`SDKNotAvailableError` without touching the filesystem again.
+    """
+    global _dll, _dll_path, _dll_error
     if _dll is not None:
         return _dll
+    if _dll_error is not None:
+        raise SDKNotAvailableError(_dll_error)
 
     path = _find_dll()
     if path is None:
-        raise SDKNotAvailableError(
-            "crpe32.dll not found. Install Crystal Reports or set "
-            "CRPE32_DLL_PATH environment variable."
-        )
+        _dll_error = ("crpe32.dll not found. Install Crystal Reports or set "
+                      "CRPE32_DLL_PATH environment variable.")
+        raise SDKNotAvailableError(_dll_error)
 
     dll_dir = str(Path(path).parent)
     os.add_dll_directory(dll_dir)
     os.environ["PATH"] = dll_dir + ";" + os.environ.get("PATH", "")
 
     try:
-        _dll = ctypes.WinDLL(path)
+        _dll = _LazyDLL(ctypes.WinDLL(path))
     except OSError as exc:
-        raise SDKNotAvailableError(f"Failed to load crpe32.dll: {exc}") from exc
+        _dll_error = f"Failed to load crpe32.dll: {exc}"
+        raise SDKNotAvailableError(_dll_error) from exc
 
     _dll_path = path
-    _setup_prototypes(_dll)
     return _dll
 
 
 def is_sdk_available() -> bool:
     """Return True if the Crystal Reports SDK can be loaded."""
-    try:
-        _load_dll()
-        return True
-    except SDKNotAvailableError:
-        return False
+    global _sdk_available
+    if _sdk_available is None:
+        try:
+            _load_dll()
+            _sdk_available = True
+        except SDKNotAvailableError:
+            _sdk_available = False
+    return _sdk_available
 
 
 # ------------------------------------------------------------------
@@ -157,6 +172,42 @@ class PEObjectInfo(ctypes.Structure):
     ]
 
 
+class _BoxObjectInfo(ctypes.Structure):
+    """Box object info (44 bytes), partly undocumented.
+
+    ``EndSection`` holds the end section code + 65536; ``XSum`` and
+    ``YSum`` hold ``left + right`` and ``top + bottom``.
+    """
+    _fields_ = [
+        ("StructSize", PE_WORD),
+        ("_pad", ctypes.c_byte * 2),
+        ("Left", ctypes.c_int32),
+        ("Top", ctypes.c_int32),
+        ("EndSection", ctypes.c_int32),
+        ("XSum", ctypes.c_int32),
+        ("YSum", ctypes.c_int32),
+        ("_reserved", ctypes.c_byte * 20),
+    ]
+
+
+class _LineObjectInfo(ctypes.Structure):
+    """Line object info (36 bytes), partly undocumented.
+
+    Same conventions as :class:`_BoxObjectInfo`, at different offsets.
+    """
+    _fields_ = [
+        ("StructSize", PE_WORD),
+        ("_pad", ctypes.c_byte * 2),
+        ("EndSection", ctypes.c_int32),
+        ("Left", ctypes.c_int32),
+        ("Top", ctypes.c_int32),
+        ("_unknown16", ctypes.c_int32),
+        ("XSum", ctypes.c_int32),
+        ("YSum", ctypes.c_int32),
+        ("_reserved", ctypes.c_byte * 8),
+    ]
+
+
 _SECTION_AREA_NAMES = {
     1: "Report Header",
     2: "Page Header",
@@ -167,10 +218,30 @@ _SECTION_AREA_NAMES = {
     7: "Page Footer",
 }
 
-_OBJECT_TYPE_NAMES = {
-    1: "Field", 2: "Text", 3: "Line", 4: "Box",
-    5: "Subreport", 6: "OLE", 7: "Graph", 8: "CrossTab",
-    9: "BLOB", 10: "Map",
+# Indexed by PEObjectInfo.ObjectType (1..10); index 0 is unused
+_OBJECT_TYPE_NAMES = (
+    None, "Field", "Text", "Line", "Box",
+    "Subreport", "OLE", "Graph", "CrossTab",
+    "BLOB", "Map",
+)
+
+# Columns returned by CrpeJob.get_objects_soa(), in ReportObject field order
+_SOA_FIELD_ORDER = ("handle", "name", "object_type", "section_code",
+                    "left", "top", "right", "bottom", "object_type_code")
+_SOA_INT_FIELDS = ("handle", "section_code", "left", "top", "right", "bottom",
+                   "object_type_code")
+
+# CrpeJob.get_bulk() name -> getter method
+_BULK_GETTERS = {
+    "tables": "get_tables",
+    "formulas": "get_formulas",
+    "sql_query": "get_sql_query",
+    "sections": "get_sections",
+    "parameters": "get_parameters",
+    "sort_fields": "get_sort_fields",
+    "n_groups": "get_n_groups",
+    "section_codes": "get_section_codes",
+    "objects": "get_all_objects",
 }
 
 # Section codes use: area * 6000 + sub_section * 50
@@ -187,236 +258,298 @@ class DiskDestOptions(ctypes.Structure):
     ]
 
 
+# StructSize values, computed once rather than per call
+_TABLE_LOCATION_SIZE = ctypes.sizeof(PETableLocation)
+_PE_EXPORT_SIZE = ctypes.sizeof(PEExportOptions)
+_OBJECT_INFO_SIZE = ctypes.sizeof(PEObjectInfo)
+_BOX_INFO_SIZE = ctypes.sizeof(_BoxObjectInfo)
+_LINE_INFO_SIZE = ctypes.sizeof(_LineObjectInfo)
+_DISK_DEST_SIZE = ctypes.sizeof(DiskDestOptions)
+
+
 # ------------------------------------------------------------------
-# Function prototypes setup
+# Function prototypes
 # ------------------------------------------------------------------
 
-def _setup_prototypes(dll: ctypes.WinDLL) -> None:
-    """Declare argtypes/restype for the PE_ functions we use."""
+# name -> (argtypes, restype), applied lazily on first use by _LazyDLL
+_PROTOTYPES: dict[str, tuple[list, object]] = {
     # Engine lifecycle
-    dll.PEOpenEngine.argtypes = []
-    dll.PEOpenEngine.restype = ctypes.c_bool
-    dll.PECloseEngine.argtypes = []
-    dll.PECloseEngine.restype = None
+    "PEOpenEngine": ([], ctypes.c_bool),
+    "PECloseEngine": ([], None),
 
     # Print job
-    dll.PEOpenPrintJob.argtypes = [ctypes.c_char_p]
-    dll.PEOpenPrintJob.restype = PE_HANDLE
-    dll.PEClosePrintJob.argtypes = [PE_HANDLE]
-    dll.PEClosePrintJob.restype = None
+    "PEOpenPrintJob": ([ctypes.c_char_p], PE_HANDLE),
+    "PEClosePrintJob": ([PE_HANDLE], None),
 
     # Error handling
-    dll.PEGetErrorCode.argtypes = [PE_HANDLE]
-    dll.PEGetErrorCode.restype = PE_WORD
-    dll.PEGetErrorText.argtypes = [PE_HANDLE, ctypes.POINTER(ctypes.c_int), ctypes.c_char_p]
-    dll.PEGetErrorText.restype = ctypes.c_bool
+    "PEGetErrorCode": ([PE_HANDLE], PE_WORD),
+    "PEGetErrorText": (
+        [PE_HANDLE, ctypes.POINTER(ctypes.c_int), ctypes.c_char_p],
+        ctypes.c_bool,
+    ),
 
     # Tables
-    dll.PEGetNTables.argtypes = [PE_HANDLE]
-    dll.PEGetNTables.restype = PE_WORD
-    dll.PEGetNthTableLocation.argtypes = [PE_HANDLE, PE_WORD, ctypes.POINTER(PETableLocation)]
-    dll.PEGetNthTableLocation.restype = ctypes.c_bool
-    dll.PESetNthTableLocation.argtypes = [PE_HANDLE, PE_WORD, ctypes.POINTER(PETableLocation)]
-    dll.PESetNthTableLocation.restype = ctypes.c_bool
+    "PEGetNTables": ([PE_HANDLE], PE_WORD),
+    "PEGetNthTableLocation": (
+        [PE_HANDLE, PE_WORD, ctypes.POINTER(PETableLocation)], ctypes.c_bool,
+    ),
+    "PESetNthTableLocation": (
+        [PE_HANDLE, PE_WORD, ctypes.POINTER(PETableLocation)], ctypes.c_bool,
+    ),
 
     # Formula count
-    dll.PEGetNFormulas.argtypes = [PE_HANDLE]
-    dll.PEGetNFormulas.restype = PE_WORD
+    "PEGetNFormulas": ([PE_HANDLE], PE_WORD),
 
     # PEGetNthFormulaEx — returns 64-bit text handles
     # (job, index, *nameHandle, *nameLen, *textHandle, *textLen)
-    dll.PEGetNthFormulaEx.argtypes = [
-        PE_HANDLE, PE_WORD,
-        ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_int),
-    ]
-    dll.PEGetNthFormulaEx.restype = ctypes.c_bool
+    "PEGetNthFormulaEx": (
+        [
+            PE_HANDLE, PE_WORD,
+            ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_int),
+        ],
+        ctypes.c_bool,
+    ),
 
     # PEGetHandleStringEx — convert text handle to string
     # (handle, buffer, bufferSize) -> BOOL
-    dll.PEGetHandleStringEx.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
-    dll.PEGetHandleStringEx.restype = ctypes.c_bool
+    "PEGetHandleStringEx": (
+        [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], ctypes.c_bool,
+    ),
 
     # PEGetFormulaW — get formula text by name (returns text handle)
-    dll.PEGetFormulaW.argtypes = [
-        PE_HANDLE, ctypes.c_wchar_p,
-        ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_int),
-    ]
-    dll.PEGetFormulaW.restype = ctypes.c_bool
+    "PEGetFormulaW": (
+        [
+            PE_HANDLE, ctypes.c_wchar_p,
+            ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_int),
+        ],
+        ctypes.c_bool,
+    ),
 
     # PESetFormula / PESetFormulaW
-    dll.PESetFormula.argtypes = [PE_HANDLE, ctypes.c_char_p, ctypes.c_char_p]
-    dll.PESetFormula.restype = ctypes.c_bool
+    "PESetFormula": (
+        [PE_HANDLE, ctypes.c_char_p, ctypes.c_char_p], ctypes.c_bool,
+    ),
 
     # SQL query
-    dll.PEGetSQLQueryEx.argtypes = [
-        PE_HANDLE,
-        ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_int),
-    ]
-    dll.PEGetSQLQueryEx.restype = ctypes.c_bool
-
-    dll.PESetSQLQuery.argtypes = [PE_HANDLE, ctypes.c_char_p]
-    dll.PESetSQLQuery.restype = ctypes.c_bool
+    "PEGetSQLQueryEx": (
+        [
+            PE_HANDLE,
+            ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_int),
+        ],
+        ctypes.c_bool,
+    ),
+    "PESetSQLQuery": ([PE_HANDLE, ctypes.c_char_p], ctypes.c_bool),
 
     # Sections
-    dll.PEGetNSections.argtypes = [PE_HANDLE]
-    dll.PEGetNSections.restype = PE_WORD
+    "PEGetNSections": ([PE_HANDLE], PE_WORD),
 
     # Groups & sorting
-    dll.PEGetNGroups.argtypes = [PE_HANDLE]
-    dll.PEGetNGroups.restype = PE_WORD
-    dll.PEGetNSortFields.argtypes = [PE_HANDLE]
-    dll.PEGetNSortFields.restype = PE_WORD
+    "PEGetNGroups": ([PE_HANDLE], PE_WORD),
+    "PEGetNSortFields": ([PE_HANDLE], PE_WORD),
 
     # Parameters
-    dll.PEGetNParameterFields.argtypes = [PE_HANDLE]
-    dll.PEGetNParameterFields.restype = PE_WORD
+    "PEGetNParameterFields": ([PE_HANDLE], PE_WORD),
 
     # Subreports
-    dll.PEGetNSubreportsInSection.argtypes = [PE_HANDLE, PE_WORD]
-    dll.PEGetNSubreportsInSection.restype = PE_WORD
-    dll.PEOpenSubreport.argtypes = [PE_HANDLE, ctypes.c_char_p]
-    dll.PEOpenSubreport.restype = PE_HANDLE
+    "PEGetNSubreportsInSection": ([PE_HANDLE, PE_WORD], PE_WORD),
+    "PEOpenSubreport": ([PE_HANDLE, ctypes.c_char_p], PE_HANDLE),
 
     # Export
-    dll.PEExportTo.argtypes = [PE_HANDLE, ctypes.POINTER(PEExportOptions)]
-    dll.PEExportTo.restype = ctypes.c_bool
+    "PEExportTo": (
+        [PE_HANDLE, ctypes.POINTER(PEExportOptions)], ctypes.c_bool,
+    ),
 
     # Section format (for discovering valid section codes)
-    dll.PEGetSectionFormat.argtypes = [
-        PE_HANDLE, ctypes.c_short,
-        ctypes.c_void_p,  # pointer to PESectionOptions (variable size)
-    ]
-    dll.PEGetSectionFormat.restype = ctypes.c_bool
+    "PEGetSectionFormat": (
+        [
+            PE_HANDLE, ctypes.c_short,
+            ctypes.c_void_p,  # pointer to PESectionOptions (variable size)
+        ],
+        ctypes.c_bool,
+    ),
 
     # Object enumeration in sections
-    dll.PEGetNObjectsInSection.argtypes = [PE_HANDLE, ctypes.c_short]
-    dll.PEGetNObjectsInSection.restype = ctypes.c_short
-    dll.PEGetNthObjectInSection.argtypes = [PE_HANDLE, ctypes.c_short, ctypes.c_short]
-    dll.PEGetNthObjectInSection.restype = ctypes.c_int  # DWORD handle
+    "PEGetNObjectsInSection": ([PE_HANDLE, ctypes.c_short], ctypes.c_short),
+    "PEGetNthObjectInSection": (
+        [PE_HANDLE, ctypes.c_short, ctypes.c_short],
+        ctypes.c_int,  # DWORD handle
+    ),
 
     # Object info
-    dll.PEGetObjectInfo.argtypes = [
-        PE_HANDLE, ctypes.c_int, ctypes.c_void_p,
-    ]
-    dll.PEGetObjectInfo.restype = ctypes.c_bool
+    "PEGetObjectInfo": (
+        [PE_HANDLE, ctypes.c_int, ctypes.c_void_p], ctypes.c_bool,
+    ),
 
     # Object name
-    dll.PEGetObjectName.argtypes = [
-        PE_HANDLE, ctypes.c_int,
-        ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_int),
-    ]
-    dll.PEGetObjectName.restype = ctypes.c_bool
+    "PEGetObjectName": (
+        [
+            PE_HANDLE, ctypes.c_int,
+            ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_int),
+        ],
+        ctypes.c_bool,
+    ),
 
     # Object modification — SetObjectInfo (move/resize)
-    dll.PESetObjectInfo.argtypes = [PE_HANDLE, ctypes.c_int, ctypes.c_void_p]
-    dll.PESetObjectInfo.restype = ctypes.c_bool
+    "PESetObjectInfo": (
+        [PE_HANDLE, ctypes.c_int, ctypes.c_void_p], ctypes.c_bool,
+    ),
 
     # Field font — per-object font changes (works on Field objects)
-    dll.PESetFieldFont.argtypes = [
-        PE_HANDLE, ctypes.c_int,  # job, objectHandle
-        ctypes.c_char_p,  # faceName
-        ctypes.c_short,   # fontFamily (0=don't change)
-        ctypes.c_short,   # fontPitch (0=don't change)
-        ctypes.c_short,   # charSet (0=don't change)
-        ctypes.c_short,   # pointSize (0=don't change)
-        ctypes.c_short,   # isItalic (PE_UNCHANGED=3)
-        ctypes.c_short,   # isUnderlined (PE_UNCHANGED=3)
-        ctypes.c_short,   # isStrikeOut (PE_UNCHANGED=3)
-        ctypes.c_short,   # fontWeight (0=don't change, 400=normal, 700=bold)
-    ]
-    dll.PESetFieldFont.restype = ctypes.c_bool
+    "PESetFieldFont": (
+        [
+            PE_HANDLE, ctypes.c_int,  # job, objectHandle
+            ctypes.c_char_p,  # faceName
+            ctypes.c_short,   # fontFamily (0=don't change)
+            ctypes.c_short,   # fontPitch (0=don't change)
+            ctypes.c_short,   # charSet (0=don't change)
+            ctypes.c_short,   # pointSize (0=don't change)
+            ctypes.c_short,   # isItalic (PE_UNCHANGED=3)
+            ctypes.c_short,   # isUnderlined (PE_UNCHANGED=3)
+            ctypes.c_short,   # isStrikeOut (PE_UNCHANGED=3)
+            ctypes.c_short,   # fontWeight (0=don't change, 400=normal, 700=bold)
+        ],
+        ctypes.c_bool,
+    ),
 
     # Section-wide font — scope: 1=fields, 2=text, 3=both
-    dll.PESetFont.argtypes = [
-        PE_HANDLE, ctypes.c_short, ctypes.c_short,  # job, sectionCode, scope
-        ctypes.c_char_p,  # faceName
-        ctypes.c_short,   # fontFamily
-        ctypes.c_short,   # fontPitch
-        ctypes.c_short,   # charSet
-        ctypes.c_short,   # pointSize
-        ctypes.c_short,   # isItalic
-        ctypes.c_short,   # isUnderlined
-        ctypes.c_short,   # isStrikeOut
-        ctypes.c_short,   # fontWeight
-    ]
-    dll.PESetFont.restype = ctypes.c_bool
+    "PESetFont": (
+        [
+            PE_HANDLE, ctypes.c_short, ctypes.c_short,  # job, sectionCode, scope
+            ctypes.c_char_p,  # faceName
+            ctypes.c_short,   # fontFamily
+            ctypes.c_short,   # fontPitch
+            ctypes.c_short,   # charSet
+            ctypes.c_short,   # pointSize
+            ctypes.c_short,   # isItalic
+            ctypes.c_short,   # isUnderlined
+            ctypes.c_short,   # isStrikeOut
+            ctypes.c_short,   # fontWeight
+        ],
+        ctypes.c_bool,
+    ),
 
     # Font color — MUST pass pointer to COLORREF, not direct value
-    dll.PESetObjectFontColor.argtypes = [
-        PE_HANDLE, ctypes.c_int, ctypes.POINTER(ctypes.c_ulong),
-    ]
-    dll.PESetObjectFontColor.restype = ctypes.c_bool
+    "PESetObjectFontColor": (
+        [PE_HANDLE, ctypes.c_int, ctypes.POINTER(ctypes.c_ulong)],
+        ctypes.c_bool,
+    ),
 
     # Section height — Get uses out-param, Set uses direct value
-    dll.PEGetSectionHeight.argtypes = [
-        PE_HANDLE, ctypes.c_short, ctypes.POINTER(ctypes.c_long),
-    ]
-    dll.PEGetSectionHeight.restype = ctypes.c_bool
-    dll.PESetSectionHeight.argtypes = [PE_HANDLE, ctypes.c_short, ctypes.c_long]
-    dll.PESetSectionHeight.restype = ctypes.c_bool
+    "PEGetSectionHeight": (
+        [PE_HANDLE, ctypes.c_short, ctypes.POINTER(ctypes.c_long)],
+        ctypes.c_bool,
+    ),
+    "PESetSectionHeight": (
+        [PE_HANDLE, ctypes.c_short, ctypes.c_long], ctypes.c_bool,
+    ),
 
     # Section format (read/write section properties)
-    dll.PESetSectionFormat.argtypes = [
-        PE_HANDLE, ctypes.c_short, ctypes.c_void_p,
-    ]
-    dll.PESetSectionFormat.restype = ctypes.c_bool
+    "PESetSectionFormat": (
+        [PE_HANDLE, ctypes.c_short, ctypes.c_void_p], ctypes.c_bool,
+    ),
 
     # Box object info (move/resize boxes)
-    dll.PEGetBoxObjectInfo.argtypes = [PE_HANDLE, ctypes.c_int, ctypes.c_void_p]
-    dll.PEGetBoxObjectInfo.restype = ctypes.c_bool
-    dll.PESetBoxObjectInfo.argtypes = [PE_HANDLE, ctypes.c_int, ctypes.c_void_p]
-    dll.PESetBoxObjectInfo.restype = ctypes.c_bool
+    "PEGetBoxObjectInfo": (
+        [PE_HANDLE, ctypes.c_int, ctypes.c_void_p], ctypes.c_bool,
+    ),
+    "PESetBoxObjectInfo": (
+        [PE_HANDLE, ctypes.c_int, ctypes.c_void_p], ctypes.c_bool,
+    ),
 
     # Line object info (move/resize lines)
-    dll.PEGetLineObjectInfo.argtypes = [PE_HANDLE, ctypes.c_int, ctypes.c_void_p]
-    dll.PEGetLineObjectInfo.restype = ctypes.c_bool
-    dll.PESetLineObjectInfo.argtypes = [PE_HANDLE, ctypes.c_int, ctypes.c_void_p]
-    dll.PESetLineObjectInfo.restype = ctypes.c_bool
+    "PEGetLineObjectInfo": (
+        [PE_HANDLE, ctypes.c_int, ctypes.c_void_p], ctypes.c_bool,
+    ),
+    "PESetLineObjectInfo": (
+        [PE_HANDLE, ctypes.c_int, ctypes.c_void_p], ctypes.c_bool,
+    ),
 
     # Delete object
-    dll.PEDeleteObject.argtypes = [PE_HANDLE, ctypes.c_int]
-    dll.PEDeleteObject.restype = ctypes.c_bool
+    "PEDeleteObject": ([PE_HANDLE, ctypes.c_int], ctypes.c_bool),
 
     # Margins
-    dll.PEGetMargins.argtypes = [
-        PE_HANDLE,
-        ctypes.POINTER(ctypes.c_short), ctypes.POINTER(ctypes.c_short),
-        ctypes.POINTER(ctypes.c_short), ctypes.POINTER(ctypes.c_short),
-    ]
-    dll.PEGetMargins.restype = ctypes.c_bool
-    dll.PESetMargins.argtypes = [
-        PE_HANDLE, ctypes.c_short, ctypes.c_short,
-        ctypes.c_short, ctypes.c_short,
-    ]
-    dll.PESetMargins.restype = ctypes.c_bool
+    "PEGetMargins": (
+        [
+            PE_HANDLE,
+            ctypes.POINTER(ctypes.c_short), ctypes.POINTER(ctypes.c_short),
+            ctypes.POINTER(ctypes.c_short), ctypes.POINTER(ctypes.c_short),
+        ],
+        ctypes.c_bool,
+    ),
+    "PESetMargins": (
+        [
+            PE_HANDLE, ctypes.c_short, ctypes.c_short,
+            ctypes.c_short, ctypes.c_short,
+        ],
+        ctypes.c_bool,
+    ),
 
     # Suppress dialogs (optional — not present in all builds)
-    try:
-        dll.PESetDialogParentWindowHandle.argtypes = [PE_HANDLE, wt.HWND]
-        dll.PESetDialogParentWindowHandle.restype = ctypes.c_bool
-    except AttributeError:
-        pass
+    "PESetDialogParentWindowHandle": ([PE_HANDLE, wt.HWND], ctypes.c_bool),
 
     # Save (optional — not present in all builds)
-    try:
-        dll.PESavePrintJob.argtypes = [PE_HANDLE, ctypes.c_char_p]
-        dll.PESavePrintJob.restype = ctypes.c_bool
-    except AttributeError:
-        pass
+    "PESavePrintJob": ([PE_HANDLE, ctypes.c_char_p], ctypes.c_bool),
+}
+
+
+class _LazyDLL:
+    """Proxy around the loaded crpe32.dll that declares prototypes lazily.
+
+    A function is looked up in the DLL and given its argtypes/restype from
+    :data:`_PROTOTYPES` on first access only; the configured function is
+    then cached on the proxy so later lookups are plain attribute reads.
+    Optional exports missing from a build raise :class:`AttributeError`;
+    the miss is remembered, so probing again with ``getattr(dll, name,
+    None)`` does not repeat the DLL lookup.  With ``CRPE_PROFILE=1`` each
+    function is wrapped by :func:`~.profiling.profile_function` before it
+    is cached.
+    """
+
+    def __init__(self, dll: ctypes.WinDLL):
+        self._raw = dll
+        self._missing: set[str] = set()
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or name in self._missing:
+            raise AttributeError(name)
+        try:
+            func = getattr(self._raw, name)
+        except AttributeError:
+            self._missing.add(name)
+            raise
+        proto = _PROTOTYPES.get(name)
+        if proto is not None:
+            func.argtypes, func.restype = proto
+        func = profile_function(func, name)
+        setattr(self, name, func)
+        return func
 
 
 # ------------------------------------------------------------------
 # Error helpers
 # ------------------------------------------------------------------
 
+# Per-thread scratch buffers, allocated once and reused across calls
+_TLS = threading.local()
+
+_ERROR_BUF_SIZE = 512
+
+
 def _get_error_text(dll, job_handle: int) -> str:
-    """Retrieve the last error message from the engine."""
-    text_handle = ctypes.c_int(0)
-    buf = ctypes.create_string_buffer(512)
+    """Retrieve the last error message from the engine.
+
+    Only called on failure, but the no-error case still returns before
+    any ctypes object is created or fetched; keep it that way.
+    """
     code = dll.PEGetErrorCode(job_handle)
     if code == 0:
         return ""
+    text_handle = ctypes.c_int(0)
+    buf = getattr(_TLS, "error_buf", None)
+    if buf is None:
+        buf = _TLS.error_buf = ctypes.create_string_buffer(_ERROR_BUF_SIZE)
+    buf[0] = b"\x00"
     try:
         dll.PEGetErrorText(job_handle, ctypes.byref(text_handle), buf)
         return f"PE error {code}: {buf.value.decode('latin-1', errors='replace')}"
@@ -424,9 +557,17 @@ def _get_error_text(dll, job_handle: int) -> str:
         return f"PE error {code}"
 
 
-def _check(dll, job_handle: int, result: bool, action: str = "") -> None:
-    """Raise on failure."""
+def _check(dll, job_handle: int, result: bool, action: str = "",
+           *args) -> None:
+    """Raise on failure.
+
+    When *args* are given, *action* is a ``%``-style template formatted
+    with them only if the call failed, so callers need not build the
+    message on every successful call.
+    """
     if not result:
+        if args:
+            action = action % args
         msg = _get_error_text(dll, job_handle)
         raise CrystalReportsError(f"{action} failed: {msg}" if action else msg)
 
@@ -442,13 +583,79 @@ def _handle_to_str(dll, handle_value: int) -> str:
     """Convert a CRPE text handle (from Ex functions) to a Python string."""
     if not handle_value:
         return ""
-    buf = ctypes.create_string_buffer(_HANDLE_BUF_SIZE)
+    buf = getattr(_TLS, "handle_buf", None)
+    if buf is None:
+        buf = _TLS.handle_buf = ctypes.create_string_buffer(_HANDLE_BUF_SIZE)
+    buf[0] = b"\x00"  # never return a previous call's string
     ok = dll.PEGetHandleStringEx(handle_value, buf, _HANDLE_BUF_SIZE)
     if ok and buf.value:
         return buf.value.decode("latin-1", errors="replace")
     return ""
 
 
+def _text_out_params():
+    """Return this thread's ``(handle, length, handle_ref, length_ref)``.
+
+    The pair receives the text handle and length written by the
+    ``PEGet...Ex``/``W`` getters.  It is allocated once per thread, and
+    the handle is cleared before it is returned.
+    """
+    params = getattr(_TLS, "text_out", None)
+    if params is None:
+        th = ctypes.c_void_p(0)
+        tl = ctypes.c_int(0)
+        params = _TLS.text_out = (th, tl, ctypes.byref(th), ctypes.byref(tl))
+    params[0].value = 0
+    return params
+
+
+def _set_cchar(struct: ctypes.Structure, field_name: str, value: bytes) -> None:
+    """Copy *value* into a fixed-size ``c_char`` field of *struct*.
+
+    The field is zero-filled first and *value* is truncated so that the
+    field always stays NUL-terminated.
+    """
+    field = getattr(type(struct), field_name)
+    addr = ctypes.addressof(struct) + field.offset
+    ctypes.memset(addr, 0, field.size)
+    ctypes.memmove(addr, value, min(len(value), field.size - 1))
+
+
+def _abs_path(path: Union[str, bytes, Path],
+              canonicalize: bool = False) -> Union[str, bytes]:
+    """Return *path* as an absolute path.  ``bytes`` paths stay ``bytes``.
+
+    By default this is pure string normalisation with no filesystem
+    access; symlinks are only resolved when *canonicalize* is true.
+    """
+    s = os.fspath(path)
+    return os.path.realpath(s) if canonicalize else os.path.abspath(s)
+
+
+@functools.lru_cache(maxsize=256)
+def _latin1(value: str) -> bytes:
+    """Encode *value* as latin-1, memoized for repeated font names/paths."""
+    return value.encode("latin-1")
+
+
+def _to_latin1(value: Union[str, bytes]) -> bytes:
+    """Encode a font name or path for the ANSI CRPE API, memoized.
+
+    ``bytes`` pass through.  Use :func:`_text_to_latin1` for formula and
+    SQL text, which can be large and is rarely repeated.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    return _latin1(value)
+
+
+def _text_to_latin1(value: Union[str, bytes]) -> bytes:
+    """Encode *value* for the ANSI CRPE API without caching it."""
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    return value.encode("latin-1")
+
+
 def rgb_to_colorref(r: int, g: int, b: int) -> int:
     """Convert RGB values (0-255) to a Windows COLORREF (0x00BBGGRR)."""
     return (b << 16) | (g << 8) | r
@@ -462,55 +669,95 @@ class CrpeJob:
     """A handle to an opened Crystal Reports print job.
 
     Use :func:`CrpeEngine.open` or the context manager to create one.
+
+    A job is not thread-safe in general.  The long-running calls
+    (:meth:`export`, :meth:`save`), :meth:`close` and the getters that
+    fill the job's caches take a per-job lock, so one job cannot be
+    closed or exported twice at once, nor race a :meth:`prefetch`,
+    while separate jobs still run in parallel: ctypes releases the GIL
+    around each foreign call.
     """
 
-    def __init__(self, dll: ctypes.WinDLL, handle: int, path: str):
+    __slots__ = ("_dll", "_handle", "_path", "_closed", "_section_codes",
+                 "_object_info", "_color", "_lock", "_height", "_height_ref",
+                 "_margins", "_margin_refs", "_export_opts", "_counts",
+                 "_object_recs")
+
+    def __init__(self, dll: _LazyDLL, handle: int, path: str):
         self._dll = dll
         self._handle = handle
         self._path = path
         self._closed = False
+        self._section_codes: Optional[list[int]] = None
+        self._object_info = PEObjectInfo()  # scratch for move_object()
+        self._color = ctypes.c_ulong(0)  # scratch for set_object_font_color()
+        # Reentrant: the prefetch worker holds it while calling getters
+        # that take it themselves
+        self._lock = threading.RLock()
+        # Out-params for the section height and margin getters
+        self._height = ctypes.c_long(0)
+        self._height_ref = ctypes.byref(self._height)
+        self._margins = tuple(ctypes.c_short(0) for _ in range(4))
+        self._margin_refs = tuple(ctypes.byref(m) for m in self._margins)
+        self._export_opts: Optional[tuple[PEExportOptions, DiskDestOptions]] = None
+        self._counts: Optional[tuple[int, int, int]] = None
+        self._object_recs: Optional[tuple[tuple, ...]] = None
 
     def close(self) -> None:
-        if not self._closed and self._handle >= 0:
-            self._dll.PEClosePrintJob(self._handle)
-            self._closed = True
+        with self._lock:
+            if not self._closed and self._handle >= 0:
+                self._dll.PEClosePrintJob(self._handle)
+                self._closed = True
 
     # -- Tables --
 
     def get_tables(self) -> list[TableInfo]:
         n = self._dll.PEGetNTables(self._handle)
         tables: list[TableInfo] = []
+        if n <= 0:
+            return tables
+        # One contiguous allocation for all tables.  c_char array fields
+        # read back as bytes that already stop at the first NUL.
+        locs = (PETableLocation * n)()
+        struct_size = _TABLE_LOCATION_SIZE
+        for loc in locs:
+            loc.StructSize = struct_size
+        get_location = self._dll.PEGetNthTableLocation
+        handle = self._handle
         for i in range(n):
-            loc = PETableLocation()
-            loc.StructSize = ctypes.sizeof(PETableLocation)
-            ok = self._dll.PEGetNthTableLocation(self._handle, i, ctypes.byref(loc))
+            loc = locs[i]
+            ok = get_location(handle, i, ctypes.byref(loc))
             if not ok:
                 continue
             tables.append(TableInfo(
                 index=i,
-                name=loc.DescriptiveName.decode("latin-1", errors="replace").rstrip("\x00"),
-                location=loc.Location.decode("latin-1", errors="replace").rstrip("\x00"),
-                sublocation=loc.SubLocation.decode("latin-1", errors="replace").rstrip("\x00"),
-                connection_string=loc.ConnectBuffer.decode("latin-1", errors="replace").rstrip("\x00"),
-                dll_name=loc.DLLName.decode("latin-1", errors="replace").rstrip("\x00"),
+                name=loc.DescriptiveName.decode("latin-1", errors="replace"),
+                location=loc.Location.decode("latin-1", errors="replace"),
+                sublocation=loc.SubLocation.decode("latin-1", errors="replace"),
+                connection_string=loc.ConnectBuffer.decode(
+                    "latin-1", errors="replace"),
+                dll_name=loc.DLLName.decode("latin-1", errors="replace"),
             ))
         return tables
 
     def set_table_location(self, index: int, location: str = "",
                            sublocation: str = "", connect_buffer: str = "",
                            dll_name: str = "") -> None:
-        """Update the connection info for the *index*-th table."""
+        """Update the connection info for the *index*-th table.
+
+        Values longer than the fixed-size CRPE fields are truncated.
+        """
         loc = PETableLocation()
-        loc.StructSize = ctypes.sizeof(PETableLocation)
+        loc.StructSize = _TABLE_LOCATION_SIZE
         self._dll.PEGetNthTableLocation(self._handle, index, ctypes.byref(loc))
         if location:
-            loc.Location = location.encode("latin-1")
+            _set_cchar(loc, "Location", location.encode("latin-1"))
         if sublocation:
-            loc.SubLocation = sublocation.encode("latin-1")
+            _set_cchar(loc, "SubLocation", sublocation.encode("latin-1"))
         if connect_buffer:
-            loc.ConnectBuffer = connect_buffer.encode("latin-1")
+            _set_cchar(loc, "ConnectBuffer", connect_buffer.encode("latin-1"))
         if dll_name:
-            loc.DLLName = dll_name.encode("latin-1")
+            _set_cchar(loc, "DLLName", dll_name.encode("latin-1"))
         ok = self._dll.PESetNthTableLocation(self._handle, index, ctypes.byref(loc))
         _check(self._dll, self._handle, ok, "SetNthTableLocation")
 
@@ -518,64 +765,66 @@ class CrpeJob:
 
     def get_formulas(self) -> list[FormulaInfo]:
         n = self._dll.PEGetNFormulas(self._handle)
-        formulas: list[FormulaInfo] = []
+        # Out-params are allocated once and reused for every formula;
+        # the lengths are not needed, so both share one dummy c_int.
+        nh = ctypes.c_void_p(0)
+        th = ctypes.c_void_p(0)
+        length = ctypes.c_int(0)
+        nh_ref, th_ref = ctypes.byref(nh), ctypes.byref(th)
+        len_ref = ctypes.byref(length)
+        handles: list[Optional[tuple[int, int]]] = []
+        get_nth = self._dll.PEGetNthFormulaEx
+        handle = self._handle
         for i in range(n):
-            nh = ctypes.c_void_p(0)
-            nl = ctypes.c_int(0)
-            th = ctypes.c_void_p(0)
-            tl = ctypes.c_int(0)
-            ok = self._dll.PEGetNthFormulaEx(
-                self._handle, i,
-                ctypes.byref(nh), ctypes.byref(nl),
-                ctypes.byref(th), ctypes.byref(tl),
-            )
+            nh.value = 0
+            th.value = 0
+            ok = get_nth(handle, i, nh_ref, len_ref, th_ref, len_ref)
+            handles.append((nh.value, th.value) if ok else None)
+
+        dll = self._dll
+        formulas: list[FormulaInfo] = []
+        for i, pair in enumerate(handles):
             name = f"Formula{i}"
             text = ""
-            if ok:
-                name = _handle_to_str(self._dll, nh.value) or name
-                text = _handle_to_str(self._dll, th.value)
+            if pair is not None:
+                name = _handle_to_str(dll, pair[0]) or name
+                text = _handle_to_str(dll, pair[1])
             formulas.append(FormulaInfo(index=i, name=name, text=text))
         return formulas
 
     def get_formula(self, name: str) -> str:
         """Get formula text by name (e.g. ``"FileName"`` or ``"{@FileName}"``)."""
         clean = name.strip("{}").lstrip("@")
-        th = ctypes.c_void_p(0)
-        tl = ctypes.c_int(0)
-        ok = self._dll.PEGetFormulaW(
-            self._handle, clean,
-            ctypes.byref(th), ctypes.byref(tl),
-        )
+        th, _, th_ref, tl_ref = _text_out_params()
+        ok = self._dll.PEGetFormulaW(self._handle, clean, th_ref, tl_ref)
         if ok:
             return _handle_to_str(self._dll, th.value)
         return ""
 
-    def set_formula(self, name: str, text: str) -> None:
+    def set_formula(self, name: Union[str, bytes],
+                    text: Union[str, bytes]) -> None:
         """Set formula text by name.
 
         The name should be the bare formula name (e.g. ``"FileName"``),
-        without the ``@`` or ``{@...}`` wrapper.
+        without the ``@`` or ``{@...}`` wrapper.  Already-encoded
+        ``bytes`` are passed through without re-encoding.
         """
-        clean = name.strip("{}").lstrip("@")
-        ok = self._dll.PESetFormula(
-            self._handle,
-            clean.encode("latin-1"),
-            text.encode("latin-1"),
-        )
-        _check(self._dll, self._handle, ok, f"SetFormula({name})")
+        clean = _text_to_latin1(name).strip(b"{}").lstrip(b"@")
+        ok = self._dll.PESetFormula(self._handle, clean,
+                                    _text_to_latin1(text))
+        _check(self._dll, self._handle, ok, "SetFormula(%s)", name)
 
     # -- SQL --
 
     def get_sql_query(self) -> str:
-        sh = ctypes.c_void_p(0)
-        sl = ctypes.c_int(0)
-        ok = self._dll.PEGetSQLQueryEx(self._handle, ctypes.byref(sh), ctypes.byref(sl))
+        sh, _, sh_ref, sl_ref = _text_out_params()
+        ok = self._dll.PEGetSQLQueryEx(self._handle, sh_ref, sl_ref)
         if ok:
             return _handle_to_str(self._dll, sh.value)
         return ""
 
-    def set_sql_query(self, sql: str) -> None:
-        ok = self._dll.PESetSQLQuery(self._handle, sql.encode("latin-1"))
+    def set_sql_query(self, sql: Union[str, bytes]) -> None:
+        ok = self._dll.PESetSQLQuery(self._handle, _text_to_latin1(sql))
         _check(self._dll, self._handle, ok, "SetSQLQuery")
 
     # -- Sections --
@@ -588,73 +837,214 @@ class CrpeJob:
         """Discover all valid section codes by probing.
 
         Section codes follow the pattern ``area * 6000 + sub * 50``.
+        The result is cached on the job until :meth:`invalidate_sections`
+        is called; a fresh list is returned each time.
         """
+        with self._lock:
+            if self._section_codes is None:
+                self._section_codes = self._probe_section_codes()
+            return list(self._section_codes)
+
+    def _probe_section_codes(self) -> list[int]:
+        """Probe the engine for every section code (uncached)."""
         codes: list[int] = []
-        probe = ctypes.create_string_buffer(_SECTION_PROBE_SIZE)
-        struct_size = PE_WORD(_SECTION_PROBE_SIZE)
-        ctypes.memmove(probe, ctypes.byref(struct_size), 2)  # set StructSize
+        probe = (ctypes.c_byte * _SECTION_PROBE_SIZE)()
+        ctypes.cast(probe, ctypes.POINTER(PE_WORD))[0] = _SECTION_PROBE_SIZE
+        # Up to 800 probe calls: bind the function and handle once.
+        get_format = self._dll.PEGetSectionFormat
+        handle = self._handle
+        # Stop as soon as every section the engine reports has been found
+        n_total = self._dll.PEGetNSections(handle)
         for area in range(1, 9):
             base = area * _SECTION_AREA_MULTIPLIER
             for sub in range(100):  # max 100 sub-sections per area
                 code = base + sub * _SECTION_SUB_STEP
-                ok = self._dll.PEGetSectionFormat(
-                    self._handle, code, probe,
-                )
+                ok = get_format(handle, code, probe)
                 if ok:
                     codes.append(code)
+                    if len(codes) == n_total:
+                        break
                 elif sub > 0:
                     break  # no more sub-sections in this area
+            if len(codes) == n_total:
+                break
         return codes
 
+    def invalidate_sections(self) -> None:
+        """Forget the cached section codes so the next lookup re-probes.
+
+        The cached object listing depends on them and is dropped too.
+        """
+        with self._lock:
+            self._section_codes = None
+            self._object_recs = None
+
+    def invalidate_objects(self) -> None:
+        """Forget the cached object listing (see :meth:`get_all_objects`)."""
+        with self._lock:
+            self._object_recs = None
+
     # -- Objects --
 
+    def _object_records(self, section_codes):
+        """Yield ``(handle, name, object_type, section_code, left, top,
+        right, bottom, object_type_code)`` tuples for the objects in
+        *section_codes*.
+
+        The tuple order matches the fields of :class:`ReportObject`.
+        Sections are walked in the given order, sharing one set of
+        ctypes scratch objects.
+        """
+        dll = self._dll
+        handle = self._handle
+        get_count = dll.PEGetNObjectsInSection
+        get_nth = dll.PEGetNthObjectInSection
+        get_info = dll.PEGetObjectInfo
+        get_name = dll.PEGetObjectName
+        # One info struct and one set of name out-params serve every
+        # object; each record is copied out as plain ints before the
+        # next call overwrites them.
+        info = PEObjectInfo()
+        info_size = _OBJECT_INFO_SIZE
+        info.StructSize = info_size
+        info_ref = ctypes.byref(info)
+        nh = ctypes.c_void_p(0)
+        nl = ctypes.c_int(0)
+        nh_ref, nl_ref = ctypes.byref(nh), ctypes.byref(nl)
+        type_names = _OBJECT_TYPE_NAMES
+        n_types = len(type_names)
+        for section_code in section_codes:
+            for i in range(get_count(handle, section_code)):
+                oh = get_nth(handle, section_code, i)
+                if not get_info(handle, oh, info_ref):
+                    ctypes.memset(info_ref, 0, info_size)
+                    info.StructSize = info_size
+                name = ""
+                nh.value = 0
+                if get_name(handle, oh, nh_ref, nl_ref) and nh.value:
+                    name = _handle_to_str(dll, nh.value)
+                type_code = info.ObjectType
+                if 0 < type_code < n_types:
+                    obj_type = type_names[type_code]
+                else:
+                    obj_type = f"Unknown({type_code})"
+                yield (oh, name, obj_type, section_code,
+                       info.Left, info.Top, info.Right, info.Bottom,
+                       type_code)
+
+    def get_object(self, handle: int, section_code: int) -> ReportObject:
+        """Read one report object directly by its handle.
+
+        Cheaper than searching :meth:`get_objects_in_section` to read
+        back an object's bounds, e.g. after :meth:`move_object`.
+
+        Parameters
+        ----------
+        handle : int
+            Object handle.
+        section_code : int
+            The section the object is in, stored as
+            :attr:`ReportObject.section_code`; the engine's object info
+            does not report it.
+        """
+        dll = self._dll
+        job = self._handle
+        info = PEObjectInfo()
+        info.StructSize = _OBJECT_INFO_SIZE
+        ok = dll.PEGetObjectInfo(job, handle, ctypes.byref(info))
+        _check(dll, job, ok, "GetObjectInfo(%s)", handle)
+        name = ""
+        nh = ctypes.c_void_p(0)
+        nl = ctypes.c_int(0)
+        if (dll.PEGetObjectName(job, handle, ctypes.byref(nh),
+                                ctypes.byref(nl)) and nh.value):
+            name = _handle_to_str(dll, nh.value)
+        type_code = info.ObjectType
+        if 0 < type_code < len(_OBJECT_TYPE_NAMES):
+            obj_type = _OBJECT_TYPE_NAMES[type_code]
+        else:
+            obj_type = f"Unknown({type_code})"
+        return ReportObject(handle, name, obj_type, section_code,
+                            info.Left, info.Top, info.Right, info.Bottom,
+                            type_code)
+
+    def iter_objects(self, section_code: Optional[int] = None
+                     ) -> Iterator[ReportObject]:
+        """Yield report objects one at a time.
+
+        Unless the listing is already cached (see :meth:`get_all_objects`),
+        objects are read from the engine as the iterator advances, so a
+        caller that stops early never queries the remaining ones.
+
+        Parameters
+        ----------
+        section_code : int, optional
+            Only yield objects in this section.  By default all sections
+            are walked, in the order of :meth:`get_all_objects`.
+        """
+        if section_code is None:
+            records = self._object_recs
+            if records is None:
+                records = self._object_records(self.get_section_codes())
+        else:
+            records = self._object_records((section_code,))
+        for rec in records:
+            yield ReportObject(*rec)
+
     def get_objects_in_section(self, section_code: int) -> list[ReportObject]:
         """Enumerate all report objects in the given section."""
-        n = self._dll.PEGetNObjectsInSection(self._handle, section_code)
-        if n <= 0:
-            return []
-        objects: list[ReportObject] = []
-        for i in range(n):
-            oh = self._dll.PEGetNthObjectInSection(self._handle, section_code, i)
-            info = PEObjectInfo()
-            info.StructSize = ctypes.sizeof(PEObjectInfo)
-            ok = self._dll.PEGetObjectInfo(
-                self._handle, oh, ctypes.byref(info),
-            )
-            name = ""
-            nh = ctypes.c_void_p(0)
-            nl = ctypes.c_int(0)
-            ok2 = self._dll.PEGetObjectName(
-                self._handle, oh, ctypes.byref(nh), ctypes.byref(nl),
-            )
-            if ok2 and nh.value:
-                name = _handle_to_str(self._dll, nh.value)
-            obj_type = _OBJECT_TYPE_NAMES.get(info.ObjectType,
-                                               f"Unknown({info.ObjectType})")
-            objects.append(ReportObject(
-                handle=oh,
-                name=name,
-                object_type=obj_type,
-                section_code=section_code,
-                left=info.Left,
-                top=info.Top,
-                right=info.Right,
-                bottom=info.Bottom,
-            ))
-        return objects
+        return [ReportObject(*rec)
+                for rec in self._object_records((section_code,))]
 
     def get_all_objects(self) -> list[ReportObject]:
-        """Enumerate all report objects across all sections."""
-        all_objects: list[ReportObject] = []
-        for code in self.get_section_codes():
-            all_objects.extend(self.get_objects_in_section(code))
-        return all_objects
+        """Enumerate all report objects across all sections.
+
+        The listing is read from the engine once and cached on the job
+        until an object is moved or deleted (or :meth:`invalidate_objects`
+        is called); fresh :class:`ReportObject` instances are returned
+        each time.
+        """
+        return [ReportObject(*rec) for rec in self._all_object_records()]
+
+    def _all_object_records(self) -> tuple[tuple, ...]:
+        """Cached :meth:`_object_records` for every section."""
+        with self._lock:
+            if self._object_recs is None:
+                self._object_recs = tuple(
+                    self._object_records(self.get_section_codes()))
+            return self._object_recs
+
+    def get_objects_soa(self) -> dict[str, Union[array.array, list[str]]]:
+        """Enumerate all report objects as parallel columns.
+
+        Returns a dict of equal-length columns in the same order as
+        :meth:`get_all_objects`: ``array("i")`` columns ``handle``,
+        ``section_code``, ``left``, ``top``, ``right``, ``bottom`` and
+        ``object_type_code``, and
+        list columns ``name`` and ``object_type``.  No
+        :class:`ReportObject` is created, which keeps large layouts
+        compact and suits column-wise analysis.
+
+        The keys follow the :class:`ReportObject` field order, so
+        ``map(ReportObject, *soa.values())`` builds objects lazily for
+        a caller that only needs some of the rows.
+        """
+        soa: dict[str, Union[array.array, list[str]]] = {
+            field: array.array("i") if field in _SOA_INT_FIELDS else []
+            for field in _SOA_FIELD_ORDER
+        }
+        columns = list(soa.values())
+        for rec in self._all_object_records():
+            for column, value in zip(columns, rec):
+                column.append(value)
+        return soa
 
     # -- Object modification --
 
     def move_object(self, handle: int, left: int, top: int,
                     right: int, bottom: int,
-                    section_code: int = 0) -> None:
+                    section_code: int = 0,
+                    obj_type: Optional[int] = None) -> None:
         """Move/resize an object by setting its bounds (in twips).
 
         Automatically detects the object type and uses the correct API:
@@ -667,12 +1057,26 @@ class CrpeJob:
         section_code : int, optional
             Required for Box/Line objects to auto-increase section height
             when the object bottom would exceed it.
+        obj_type : int, optional
+            The object's ``ObjectType`` code, if already known (see
+            :attr:`ReportObject.object_type_code`).  Boxes and lines are
+            then moved without first reading the object info.
         """
-        # Read object info to determine type
-        info = PEObjectInfo()
-        info.StructSize = ctypes.sizeof(PEObjectInfo)
-        ok = self._dll.PEGetObjectInfo(self._handle, handle, ctypes.byref(info))
-        _check(self._dll, self._handle, ok, f"GetObjectInfo({handle})")
+        self._object_recs = None
+        if obj_type == 4:  # Box
+            self._move_box(handle, left, top, right, bottom, section_code)
+            return
+        if obj_type == 3:  # Line
+            self._move_line(handle, left, top, right, bottom, section_code)
+            return
+
+        # Read object info to determine type; PESetObjectInfo also needs
+        # the remaining fields filled in.  One struct serves every move.
+        info = self._object_info
+        info.StructSize = _OBJECT_INFO_SIZE
+        info_ref = ctypes.byref(info)
+        ok = self._dll.PEGetObjectInfo(self._handle, handle, info_ref)
+        _check(self._dll, self._handle, ok, "GetObjectInfo(%s)", handle)
 
         obj_type = info.ObjectType
         if obj_type == 4:  # Box
@@ -684,30 +1088,38 @@ class CrpeJob:
             info.Top = top
             info.Right = right
             info.Bottom = bottom
-            ok = self._dll.PESetObjectInfo(
-                self._handle, handle, ctypes.byref(info),
-            )
-            _check(self._dll, self._handle, ok, f"SetObjectInfo({handle})")
+            ok = self._dll.PESetObjectInfo(self._handle, handle, info_ref)
+            _check(self._dll, self._handle, ok, "SetObjectInfo(%s)", handle)
+
+    def move_object_batch(self, moves) -> None:
+        """Move/resize several objects.
+
+        CRPE has no bulk move call, so each object is still moved with
+        its own engine call; :meth:`CrystalReport.move_object_batch`
+        uses this to invalidate its caches once per batch.  Stops with
+        :class:`CrystalReportsError` at the first move that fails.
+
+        Parameters
+        ----------
+        moves : iterable of tuple
+            ``(handle, left, top, right, bottom, section_code, obj_type)``
+            tuples, the arguments of :meth:`move_object`; the last two
+            may be omitted.
+        """
+        move = self.move_object
+        for args in moves:
+            move(*args)
 
     def _ensure_section_height(self, section_code: int, needed: int) -> None:
         """Increase section height if *needed* exceeds current height."""
         if section_code <= 0:
             return
-        height = ctypes.c_long(0)
-        ok = self._dll.PEGetSectionHeight(
-            self._handle, section_code, ctypes.byref(height),
-        )
-        if ok and needed > height.value:
+        ok, height = self._read_section_height(section_code)
+        if ok and needed > height:
             self._dll.PESetSectionHeight(
                 self._handle, section_code, needed + 20,
             )
-
-    @staticmethod
-    def _set_long_at(buf, offset: int, value: int) -> None:
-        """Write a signed 32-bit int into *buf* at *offset*."""
-        b = value.to_bytes(4, "little", signed=True)
-        for i in range(4):
-            buf[offset + i] = b[i]
+            self.invalidate_sections()
 
     def _move_box(self, handle: int, left: int, top: int,
                   right: int, bottom: int, section_code: int) -> None:
@@ -724,16 +1136,16 @@ class CrpeJob:
         offset 12 and temporarily increasing the section height so that
         offset 20 is not clamped.
         """
-        buf = (ctypes.c_byte * 44)()
-        ctypes.cast(buf, ctypes.POINTER(ctypes.c_ushort))[0] = 44
-        ok = self._dll.PEGetBoxObjectInfo(self._handle, handle, buf)
-        _check(self._dll, self._handle, ok, f"GetBoxObjectInfo({handle})")
+        info = _BoxObjectInfo()
+        info.StructSize = _BOX_INFO_SIZE
+        info_ref = ctypes.byref(info)
+        ok = self._dll.PEGetBoxObjectInfo(self._handle, handle, info_ref)
+        _check(self._dll, self._handle, ok, "GetBoxObjectInfo(%s)", handle)
 
         # Detect cross-section box via offset 12
         is_cross = False
         if section_code > 0:
-            off12 = _struct.unpack_from("<i", bytes(buf), 12)[0]
-            is_cross = off12 != section_code + 65536
+            is_cross = info.EndSection != section_code + 65536
 
         if is_cross and section_code > 0:
             # Convert cross-section to same-section:
@@ -750,25 +1162,25 @@ class CrpeJob:
                 self._dll.PESetSectionHeight(
                     self._handle, section_code, needed + 20,
                 )
-            self._set_long_at(buf, 4, left)
-            self._set_long_at(buf, 8, top)
-            self._set_long_at(buf, 12, section_code + 65536)
-            self._set_long_at(buf, 16, left + right)
-            self._set_long_at(buf, 20, top + bottom)
-            ok = self._dll.PESetBoxObjectInfo(self._handle, handle, buf)
-            _check(self._dll, self._handle, ok, f"SetBoxObjectInfo({handle})")
+            info.Left = left
+            info.Top = top
+            info.EndSection = section_code + 65536
+            info.XSum = left + right
+            info.YSum = top + bottom
+            ok = self._dll.PESetBoxObjectInfo(self._handle, handle, info_ref)
+            _check(self._dll, self._handle, ok, "SetBoxObjectInfo(%s)", handle)
             # Restore section height
             self._dll.PESetSectionHeight(
                 self._handle, section_code, orig_height.value,
             )
         else:
             self._ensure_section_height(section_code, top + bottom)
-            self._set_long_at(buf, 4, left)
-            self._set_long_at(buf, 8, top)
-            self._set_long_at(buf, 16, left + right)
-            self._set_long_at(buf, 20, top + bottom)
-            ok = self._dll.PESetBoxObjectInfo(self._handle, handle, buf)
-            _check(self._dll, self._handle, ok, f"SetBoxObjectInfo({handle})")
+            info.Left = left
+            info.Top = top
+            info.XSum = left + right
+            info.YSum = top + bottom
+            ok = self._dll.PESetBoxObjectInfo(self._handle, handle, info_ref)
+            _check(self._dll, self._handle, ok, "SetBoxObjectInfo(%s)", handle)
 
     def _move_line(self, handle: int, left: int, top: int,
                    right: int, bottom: int, section_code: int) -> None:
@@ -783,31 +1195,51 @@ class CrpeJob:
         Cross-section lines have offset 4 != section_code + 65536;
         for those only left and top are reliably modified.
         """
-        buf = (ctypes.c_byte * 36)()
-        ctypes.cast(buf, ctypes.POINTER(ctypes.c_ushort))[0] = 36
-        ok = self._dll.PEGetLineObjectInfo(self._handle, handle, buf)
-        _check(self._dll, self._handle, ok, f"GetLineObjectInfo({handle})")
+        info = _LineObjectInfo()
+        info.StructSize = _LINE_INFO_SIZE
+        info_ref = ctypes.byref(info)
+        ok = self._dll.PEGetLineObjectInfo(self._handle, handle, info_ref)
+        _check(self._dll, self._handle, ok, "GetLineObjectInfo(%s)", handle)
 
         # Detect cross-section line via offset 4
         is_cross = False
         if section_code > 0:
-            off4 = _struct.unpack_from("<i", bytes(buf), 4)[0]
-            is_cross = off4 != section_code + 65536
+            is_cross = info.EndSection != section_code + 65536
 
-        if is_cross:
-            self._set_long_at(buf, 8, left)
-            self._set_long_at(buf, 12, top)
-        else:
+        info.Left = left
+        info.Top = top
+        if not is_cross:
             self._ensure_section_height(section_code, top + bottom)
-            self._set_long_at(buf, 8, left)
-            self._set_long_at(buf, 12, top)
-            self._set_long_at(buf, 20, left + right)
-            self._set_long_at(buf, 24, top + bottom)
+            info.XSum = left + right
+            info.YSum = top + bottom
 
-        ok = self._dll.PESetLineObjectInfo(self._handle, handle, buf)
-        _check(self._dll, self._handle, ok, f"SetLineObjectInfo({handle})")
+        ok = self._dll.PESetLineObjectInfo(self._handle, handle, info_ref)
+        _check(self._dll, self._handle, ok, "SetLineObjectInfo(%s)", handle)
 
-    def set_field_font(self, handle: int, face_name: str = "",
+    @staticmethod
+    def _field_font_args(face_name: Union[str, bytes], point_size: int,
+                         bold: Optional[bool], italic: Optional[bool],
+                         underline: Optional[bool],
+                         strikeout: Optional[bool]) -> tuple:
+        """Build the PESetFieldFont arguments that follow the object handle."""
+        PE_UNCHANGED = 3
+        name_bytes = _to_latin1(face_name) if face_name else b""
+        weight = 0  # don't change
+        if bold is True:
+            weight = 700
+        elif bold is False:
+            weight = 400
+        return (
+            name_bytes,
+            0, 0, 0,  # fontFamily, fontPitch, charSet — don't change
+            point_size,
+            (1 if italic is True else 0 if italic is False else PE_UNCHANGED),
+            (1 if underline is True else 0 if underline is False else PE_UNCHANGED),
+            (1 if strikeout is True else 0 if strikeout is False else PE_UNCHANGED),
+            weight,
+        )
+
+    def set_field_font(self, handle: int, face_name: Union[str, bytes] = "",
                        point_size: int = 0, bold: Optional[bool] = None,
                        italic: Optional[bool] = None,
                        underline: Optional[bool] = None,
@@ -827,25 +1259,33 @@ class CrpeJob:
         italic, underline, strikeout : bool or None
             Same behaviour as *bold*.
         """
-        PE_UNCHANGED = 3
-        name_bytes = face_name.encode("latin-1") if face_name else b""
-        weight = 0  # don't change
-        if bold is True:
-            weight = 700
-        elif bold is False:
-            weight = 400
-        ok = self._dll.PESetFieldFont(
-            self._handle, handle, name_bytes,
-            0, 0, 0,  # fontFamily, fontPitch, charSet — don't change
-            point_size,
-            (1 if italic is True else 0 if italic is False else PE_UNCHANGED),
-            (1 if underline is True else 0 if underline is False else PE_UNCHANGED),
-            (1 if strikeout is True else 0 if strikeout is False else PE_UNCHANGED),
-            weight,
-        )
-        _check(self._dll, self._handle, ok, f"SetFieldFont({handle})")
-
-    def set_section_font(self, section_code: int, face_name: str = "",
+        args = self._field_font_args(face_name, point_size, bold, italic,
+                                     underline, strikeout)
+        ok = self._dll.PESetFieldFont(self._handle, handle, *args)
+        _check(self._dll, self._handle, ok, "SetFieldFont(%s)", handle)
+
+    def set_field_font_batch(self, handles, face_name: Union[str, bytes] = "",
+                             point_size: int = 0,
+                             bold: Optional[bool] = None,
+                             italic: Optional[bool] = None,
+                             underline: Optional[bool] = None,
+                             strikeout: Optional[bool] = None) -> None:
+        """Apply the same font change to several Field objects.
+
+        Equivalent to calling :meth:`set_field_font` for each handle in
+        *handles*, but the arguments are prepared once.  Stops with
+        :class:`CrystalReportsError` at the first object that fails.
+        """
+        args = self._field_font_args(face_name, point_size, bold, italic,
+                                     underline, strikeout)
+        set_font = self._dll.PESetFieldFont
+        job = self._handle
+        for handle in handles:
+            ok = set_font(job, handle, *args)
+            _check(self._dll, job, ok, "SetFieldFont(%s)", handle)
+
+    def set_section_font(self, section_code: int,
+                         face_name: Union[str, bytes] = "",
                          point_size: int = 0, bold: Optional[bool] = None,
                          italic: Optional[bool] = None,
                          scope: int = 1) -> None:
@@ -858,16 +1298,67 @@ class CrpeJob:
         scope : int
             1 = field objects, 2 = text objects, 3 = both.
         """
+        args = self._section_font_args(face_name, point_size, bold, italic)
+        ok = self._dll.PESetFont(self._handle, section_code, scope, *args)
+        _check(self._dll, self._handle, ok,
+               "SetFont(section=%s, scope=%s)", section_code, scope)
+
+    def set_section_font_batch(self, section_codes,
+                               face_name: Union[str, bytes] = "",
+                               point_size: int = 0,
+                               bold: Optional[bool] = None,
+                               italic: Optional[bool] = None,
+                               scope: int = 1) -> None:
+        """Apply the same font change to several sections.
+
+        Equivalent to calling :meth:`set_section_font` for each code in
+        *section_codes*, but the arguments are prepared once.  CRPE has
+        no report-wide font call, and ``PESetFont`` fails on sections
+        without matching objects (e.g. some Page Footers), so pass only
+        the sections that need the change.  Stops with
+        :class:`CrystalReportsError` at the first section that fails.
+        """
+        apply = self.make_font_applier(face_name, point_size, bold, italic)
+        for section_code in section_codes:
+            apply(section_code, scope)
+
+    def make_font_applier(self, face_name: Union[str, bytes] = "",
+                          point_size: int = 0, bold: Optional[bool] = None,
+                          italic: Optional[bool] = None):
+        """Prepare a font change for repeated :meth:`set_section_font` use.
+
+        Returns a callable ``apply(section_code, scope=1)`` with the face
+        name and other ``PESetFont`` arguments converted once, for
+        applying one font to many sections while still handling each
+        section's failure separately.
+        """
+        args = self._section_font_args(face_name, point_size, bold, italic)
+        dll = self._dll
+        set_font = dll.PESetFont
+        job = self._handle
+
+        def apply(section_code: int, scope: int = 1) -> None:
+            ok = set_font(job, section_code, scope, *args)
+            _check(dll, job, ok,
+                   "SetFont(section=%s, scope=%s)", section_code, scope)
+
+        return apply
+
+    @staticmethod
+    def _section_font_args(face_name: Union[str, bytes], point_size: int,
+                           bold: Optional[bool],
+                           italic: Optional[bool]) -> tuple:
+        """Build the PESetFont arguments that follow the scope."""
         # NOTE: PESetFont uses 0="off/don't change", 1="on" for booleans.
         # Unlike PESetFieldFont which uses PE_UNCHANGED=3.
-        name_bytes = face_name.encode("latin-1") if face_name else b""
+        name_bytes = _to_latin1(face_name) if face_name else b""
         weight = 0
         if bold is True:
             weight = 700
         elif bold is False:
             weight = 400
-        ok = self._dll.PESetFont(
-            self._handle, section_code, scope, name_bytes,
+        return (
+            name_bytes,
             0, 0, 0,  # fontFamily, fontPitch, charSet
             point_size,
             (1 if italic is True else 0),
@@ -875,8 +1366,6 @@ class CrpeJob:
             0,  # strikeout off
             weight,
         )
-        _check(self._dll, self._handle, ok,
-               f"SetFont(section={section_code}, scope={scope})")
 
     def set_object_font_color(self, handle: int, color: int) -> None:
         """Set font color for an object.
@@ -889,44 +1378,45 @@ class CrpeJob:
             COLORREF value (``0x00BBGGRR``).
             Use :func:`rgb_to_colorref` to convert from (r, g, b).
         """
-        c = ctypes.c_ulong(color)
+        c = self._color
+        c.value = color
         ok = self._dll.PESetObjectFontColor(
             self._handle, handle, ctypes.byref(c),
         )
-        _check(self._dll, self._handle, ok, f"SetObjectFontColor({handle})")
+        _check(self._dll, self._handle, ok, "SetObjectFontColor(%s)", handle)
 
     def delete_object(self, handle: int) -> None:
         """Delete a report object."""
+        self._object_recs = None
         ok = self._dll.PEDeleteObject(self._handle, handle)
-        _check(self._dll, self._handle, ok, f"DeleteObject({handle})")
+        _check(self._dll, self._handle, ok, "DeleteObject(%s)", handle)
 
-    def get_section_height(self, section_code: int) -> int:
-        """Get section height in twips."""
-        height = ctypes.c_long(0)
+    def _read_section_height(self, section_code: int) -> tuple[bool, int]:
+        """Return ``(ok, height)`` from PEGetSectionHeight."""
+        self._height.value = 0
         ok = self._dll.PEGetSectionHeight(
-            self._handle, section_code, ctypes.byref(height),
+            self._handle, section_code, self._height_ref,
         )
+        return ok, self._height.value
+
+    def get_section_height(self, section_code: int) -> int:
+        """Get section height in twips."""
+        ok, height = self._read_section_height(section_code)
         _check(self._dll, self._handle, ok,
-               f"GetSectionHeight({section_code})")
-        return height.value
+               "GetSectionHeight(%s)", section_code)
+        return height
 
     def set_section_height(self, section_code: int, height: int) -> None:
         """Set section height in twips."""
         ok = self._dll.PESetSectionHeight(self._handle, section_code, height)
+        self.invalidate_sections()
         _check(self._dll, self._handle, ok,
-               f"SetSectionHeight({section_code})")
+               "SetSectionHeight(%s)", section_code)
 
     def get_margins(self) -> tuple[int, int, int, int]:
         """Get page margins as ``(left, right, top, bottom)`` in twips."""
-        ml = ctypes.c_short(0)
-        mr = ctypes.c_short(0)
-        mt = ctypes.c_short(0)
-        mb = ctypes.c_short(0)
-        ok = self._dll.PEGetMargins(
-            self._handle,
-            ctypes.byref(ml), ctypes.byref(mr),
-            ctypes.byref(mt), ctypes.byref(mb),
-        )
+        ml, mr, mt, mb = self._margins
+        ok = self._dll.PEGetMargins(self._handle, *self._margin_refs)
         _check(self._dll, self._handle, ok, "GetMargins")
         return ml.value, mr.value, mt.value, mb.value
 
@@ -939,53 +1429,152 @@ class CrpeJob:
     # -- Parameters --
 
     def get_parameters(self) -> list[ParameterInfo]:
-        n = self._dll.PEGetNParameterFields(self._handle)
-        return [ParameterInfo(index=i) for i in range(n)]
+        return [ParameterInfo(index=i) for i in range(self._get_counts()[0])]
 
     # -- Sort fields --
 
     def get_sort_fields(self) -> list[SortFieldInfo]:
-        n = self._dll.PEGetNSortFields(self._handle)
-        return [SortFieldInfo(index=i) for i in range(n)]
+        return [SortFieldInfo(index=i) for i in range(self._get_counts()[1])]
 
     # -- Groups --
 
     def get_n_groups(self) -> int:
-        return self._dll.PEGetNGroups(self._handle)
+        return self._get_counts()[2]
+
+    # -- Schema --
+
+    def get_schema(self) -> ReportSchema:
+        """Return parameters, sort fields and the group count together."""
+        n_params, n_sorts, n_groups = self._get_counts()
+        return ReportSchema(
+            n_parameters=n_params,
+            n_sort_fields=n_sorts,
+            n_groups=n_groups,
+            parameters=[ParameterInfo(index=i) for i in range(n_params)],
+            sort_fields=[SortFieldInfo(index=i) for i in range(n_sorts)],
+        )
+
+    def _get_counts(self) -> tuple[int, int, int]:
+        """Parameter, sort-field and group counts, read once per job.
+
+        No method of this class changes them, so they are never
+        invalidated; the lists built from them are fresh on every call.
+        """
+        with self._lock:
+            if self._counts is None:
+                dll = self._dll
+                handle = self._handle
+                self._counts = (
+                    dll.PEGetNParameterFields(handle),
+                    dll.PEGetNSortFields(handle),
+                    dll.PEGetNGroups(handle),
+                )
+            return self._counts
+
+    # -- Prefetch --
+
+    def prefetch(self) -> concurrent.futures.Future:
+        """Enumerate the report structure on a background thread.
+
+        Returns a :class:`~concurrent.futures.Future` whose result is a
+        dict with the keys ``tables``, ``formulas``, ``sql_query``,
+        ``sections``, ``parameters`` and ``sort_fields``.  The getters run
+        one after another on a single worker thread, so Python-side work
+        in the caller overlaps with the native calls.
+
+        The worker holds the job lock for the whole enumeration, so
+        :meth:`close`, :meth:`export`, :meth:`save` and the getters that
+        fill the job's caches (section codes, objects, parameter and
+        sort-field counts) wait for it to finish instead of racing it.
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="crpe-prefetch",
+        )
+        try:
+            return executor.submit(self._fetch_all)
+        finally:
+            executor.shutdown(wait=False)
+
+    def _fetch_all(self) -> dict:
+        with self._lock:
+            if self._closed:
+                raise CrystalReportsError(
+                    f"Print job was closed before prefetch ran: {self._path}")
+            return self.get_bulk(("tables", "formulas", "sql_query",
+                                  "sections", "parameters", "sort_fields"))
+
+    def get_bulk(self, include) -> dict:
+        """Run several getters in one pass and return ``{name: result}``.
+
+        Valid names are the keys of :data:`_BULK_GETTERS`: ``tables``,
+        ``formulas``, ``sql_query``, ``sections``, ``parameters``,
+        ``sort_fields``, ``n_groups``, ``section_codes`` and ``objects``.
+        Parameter, sort-field and group counts share one read, as do
+        section codes and objects.
+        """
+        unknown = [name for name in include if name not in _BULK_GETTERS]
+        if unknown:
+            raise ValueError(f"Unknown properties: {', '.join(unknown)}")
+        return {name: getattr(self, _BULK_GETTERS[name])()
+                for name in include}
 
     # -- Export --
 
-    def export(self, output_path: Union[str, Path],
-               fmt: ExportFormat = ExportFormat.PDF) -> None:
-        """Export the report to the given format."""
-        output_path = str(Path(output_path).resolve())
+    def export(self, output_path: Union[str, bytes, Path],
+               fmt: ExportFormat = ExportFormat.PDF,
+               canonicalize: bool = False) -> None:
+        """Export the report to the given format.
+
+        *output_path* is made absolute without touching the filesystem;
+        pass ``canonicalize=True`` to also resolve symlinks.
+        """
+        output_path = _abs_path(output_path, canonicalize)
         format_dll = _FORMAT_DLLS.get(fmt)
         if format_dll is None:
             raise ExportError(f"Unsupported export format: {fmt}")
 
-        dest_opts = DiskDestOptions()
-        dest_opts.StructSize = ctypes.sizeof(DiskDestOptions)
-        dest_opts.fileName = output_path.encode("latin-1")
+        file_name = _to_latin1(output_path)
 
-        opts = PEExportOptions()
-        opts.StructSize = ctypes.sizeof(PEExportOptions)
-        opts.formatDLLName = format_dll
-        opts.destinationDLLName = _DEST_DISK_DLL
-        opts.nFormatOptions = 0
-        opts.formatOptions = None
-        opts.nDestinationOptions = ctypes.sizeof(DiskDestOptions)
-        opts.destinationOptions = ctypes.cast(ctypes.byref(dest_opts), ctypes.c_void_p)
+        with self._lock:
+            opts, dest_opts = self._export_options()
+            opts.formatDLLName = format_dll
+            dest_opts.fileName = file_name
+            ok = self._dll.PEExportTo(self._handle, ctypes.byref(opts))
+            if not ok:
+                msg = _get_error_text(self._dll, self._handle)
+                raise ExportError(f"Export to {fmt.value} failed: {msg}")
 
-        ok = self._dll.PEExportTo(self._handle, ctypes.byref(opts))
-        if not ok:
-            msg = _get_error_text(self._dll, self._handle)
-            raise ExportError(f"Export to {fmt.value} failed: {msg}")
+    def _export_options(self) -> tuple[PEExportOptions, DiskDestOptions]:
+        """Return the job's export option structs, creating them once.
+
+        Only the format DLL and the file name change between exports;
+        callers fill those in while holding ``self._lock``.
+        """
+        if self._export_opts is None:
+            dest_opts = DiskDestOptions()
+            dest_opts.StructSize = _DISK_DEST_SIZE
+
+            opts = PEExportOptions()
+            opts.StructSize = _PE_EXPORT_SIZE
+            opts.destinationDLLName = _DEST_DISK_DLL
+            opts.nFormatOptions = 0
+            opts.formatOptions = None
+            opts.nDestinationOptions = _DISK_DEST_SIZE
+            # Both structs live on the job, so the raw address stays valid
+            opts.destinationOptions = ctypes.addressof(dest_opts)
+            self._export_opts = (opts, dest_opts)
+        return self._export_opts
 
     # -- Save --
 
-    def save(self, output_path: Optional[Union[str, Path]] = None) -> None:
+    def save(self, output_path: Optional[Union[str, bytes, Path]] = None,
+             canonicalize: bool = False) -> None:
         """Save modifications to an .rpt file.
 
+        *output_path* is passed to the engine made absolute without
+        resolving symlinks; pass ``canonicalize=True`` to resolve them.
+        The check against the open file below always resolves them.
+
         .. note::
 
            The open file cannot be overwritten — you **must** provide a
@@ -998,19 +1587,24 @@ class CrpeJob:
                 "PESavePrintJob cannot overwrite the open file. "
                 "Provide a different output_path."
             )
-        dest = str(Path(output_path).resolve())
-        if dest == self._path:
+        dest_path = _abs_path(output_path, canonicalize)
+        # Compare canonical paths, so a symlink to the open file (or to
+        # its directory) cannot slip past
+        real_dest = os.path.realpath(os.fsdecode(dest_path))
+        if os.path.normcase(real_dest) == os.path.normcase(self._path):
             raise CrystalReportsError(
                 "PESavePrintJob cannot overwrite the open file. "
                 "Provide a different output_path."
             )
-        try:
-            ok = self._dll.PESavePrintJob(self._handle, dest.encode("latin-1"))
-            _check(self._dll, self._handle, ok, "SavePrintJob")
-        except AttributeError:
+        save_job = getattr(self._dll, "PESavePrintJob", None)
+        if save_job is None:
             raise CrystalReportsError(
                 "PESavePrintJob not available in this crpe32.dll build"
             )
+        dest = _to_latin1(dest_path)
+        with self._lock:
+            ok = save_job(self._handle, dest)
+            _check(self._dll, self._handle, ok, "SavePrintJob")
 
 
 # ------------------------------------------------------------------
@@ -1028,10 +1622,10 @@ class CrpeEngine:
     """
 
     def __init__(self):
-        self._dll: Optional[ctypes.WinDLL] = None
+        self._dll: Optional[_LazyDLL] = None
         self._opened = False
 
-    def _ensure_engine(self) -> ctypes.WinDLL:
+    def _ensure_engine(self) -> _LazyDLL:
         if self._dll is None:
             self._dll = _load_dll()
         if not self._opened:
@@ -1050,10 +1644,10 @@ class CrpeEngine:
             raise ReportOpenError(f"PEOpenPrintJob failed for: {rpt_path}")
 
         if suppress_dialogs:
-            try:
-                dll.PESetDialogParentWindowHandle(handle, 0)
-            except Exception:
-                pass
+            # Optional export; builds without it simply show no dialogs
+            set_parent = getattr(dll, "PESetDialogParentWindowHandle", None)
+            if set_parent is not None:
+                set_parent(handle, 0)
 
         return CrpeJob(dll, handle, rpt_path)
 
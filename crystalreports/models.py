@@ -5,7 +5,7 @@ from __future__ import annotations
 import enum
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
 
 class ExportFormat(enum.Enum):
@@ -19,7 +19,7 @@ class ExportFormat(enum.Enum):
     TXT = "txt"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportMetadata:
     """Metadata extracted from the OLE2 SummaryInformation stream."""
     title: Optional[str] = None
@@ -33,7 +33,7 @@ class ReportMetadata:
     revision_number: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TableInfo:
     """Information about a database table used in the report."""
     index: int = 0
@@ -44,7 +44,7 @@ class TableInfo:
     dll_name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FormulaInfo:
     """Information about a formula field in the report."""
     index: int = 0
@@ -52,7 +52,7 @@ class FormulaInfo:
     text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionInfo:
     """Information about a report section."""
     index: int = 0
@@ -60,7 +60,7 @@ class SectionInfo:
     name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterInfo:
     """Information about a parameter field in the report."""
     index: int = 0
@@ -72,18 +72,57 @@ class ParameterInfo:
 
 @dataclass
 class EmbeddedImage:
-    """An embedded image extracted from the OLE2 container."""
+    """An embedded image extracted from the OLE2 container.
+
+    Images returned by :meth:`OleParser.get_embedded_images` read their
+    ``data`` from the file on first access; see :meth:`lazy`.  Unlike the
+    other models this class keeps a ``__dict__``, which holds the loader
+    outside the dataclass fields.  Copying or pickling an image reads its
+    data first, so copies never depend on the open report.
+    """
     index: int = 0
     name: str = ""
     format: str = "bmp"
-    data: bytes = field(default=b"", repr=False)
+    # default_factory keeps ``data`` off the class, so a deleted instance
+    # attribute falls through to __getattr__ (see lazy())
+    data: bytes = field(default_factory=bytes, repr=False)
+
+    # Set by lazy(); plain class attributes, so not dataclass fields
+    _loader = None
+    _size = 0
+
+    @classmethod
+    def lazy(cls, index: int, name: str, format: str, size: int,
+             loader: Callable[[], bytes]) -> "EmbeddedImage":
+        """Create an image whose ``data`` is fetched by *loader* when
+        first accessed.  *size* is reported until then."""
+        image = cls(index=index, name=name, format=format)
+        image._loader = loader
+        image._size = size
+        del image.data  # resolved by __getattr__ on first access
+        return image
+
+    def __getattr__(self, name: str):
+        # Only reached while a lazy image's data has not been loaded yet
+        if name == "data" and self._loader is not None:
+            data = self._loader()
+            self.data = data
+            self._loader = None
+            return data
+        raise AttributeError(name)
+
+    def __reduce__(self):
+        # Copies and pickles carry the data itself, never the loader
+        return (type(self), (self.index, self.name, self.format, self.data))
 
     @property
     def size(self) -> int:
+        if self._loader is not None:
+            return self._size
         return len(self.data)
 
 
-@dataclass
+@dataclass(slots=True)
 class SubreportInfo:
     """Information about a subreport embedded in the report."""
     index: int = 0
@@ -91,7 +130,7 @@ class SubreportInfo:
     stream_path: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SortFieldInfo:
     """Information about a sort field."""
     index: int = 0
@@ -99,7 +138,17 @@ class SortFieldInfo:
     direction: str = "ascending"
 
 
-@dataclass
+@dataclass(slots=True)
+class ReportSchema:
+    """Parameter, sort-field and group summary of a report."""
+    n_parameters: int = 0
+    n_sort_fields: int = 0
+    n_groups: int = 0
+    parameters: list[ParameterInfo] = field(default_factory=list)
+    sort_fields: list[SortFieldInfo] = field(default_factory=list)
+
+
+@dataclass(slots=True)
 class ReportObject:
     """Information about an object on the report layout."""
     handle: int = 0
@@ -110,3 +159,4 @@ class ReportObject:
     top: int = 0
     right: int = 0
     bottom: int = 0
+    object_type_code: int = 0  # raw PEObjectInfo.ObjectType
@@ -7,9 +7,14 @@ that Crystal Reports uses as its file format.
 from __future__ import annotations
 
 import copy
+import functools
+import io
+import mmap
+import os
+import re
 import shutil
 from pathlib import Path
-from typing import Optional, Union
+from typing import NamedTuple, Optional, Union
 
 import olefile
 
@@ -17,6 +22,20 @@ from .exceptions import OleParseError, ReportOpenError
 from .models import EmbeddedImage, ReportMetadata, SubreportInfo
 
 
+# Standard OLE property streams, never subreport storages
+_STD_OLE_ENTRIES = frozenset(("\x01CompObj", "\x05SummaryInformation",
+                              "\x05DocumentSummaryInformation"))
+_EMBED_RE = re.compile(r"embedding", re.I)
+_SUB_RE = re.compile(r"subreport", re.I)
+
+
+class _OleStructure(NamedTuple):
+    """Result of :meth:`OleParser._scan_structure`."""
+    n_streams: int
+    embeddings: list[tuple[str, int]]  # (stream path, size in bytes)
+    subreports: list[SubreportInfo]
+
+
 class OleParser:
     """Read and modify Crystal Reports .rpt files at the OLE2 level.
 
@@ -27,13 +46,107 @@ class OleParser:
     """
 
     def __init__(self, path: Union[str, Path]):
-        self.path = Path(path)
+        self.path = _as_path(path)
         if not self.path.exists():
             raise ReportOpenError(f"File not found: {self.path}")
+        self._data: Optional[bytes] = None  # set by from_bytes()
+        self._open(str(self.path))
+        # Read-only map of the file for stream reads; see _read_entry()
         try:
-            self._ole = olefile.OleFileIO(str(self.path))
+            self._mm: Optional[mmap.mmap] = mmap.mmap(
+                self._ole.fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            self._mm = None
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview],
+                   name: str = "<memory>.rpt") -> "OleParser":
+        """Parse a report held in memory instead of a file on disk.
+
+        *name* only labels the report (it becomes :attr:`path`).  Methods
+        that write require an explicit output path.
+        """
+        parser = cls.__new__(cls)
+        parser.path = Path(name)
+        parser._data = bytes(data)
+        parser._mm = None  # streams are read through olefile's BytesIO
+        parser._open(io.BytesIO(parser._data))
+        return parser
+
+    def _open(self, source) -> None:
+        try:
+            self._ole = olefile.OleFileIO(source)
         except Exception as exc:
             raise ReportOpenError(f"Cannot open OLE2 file: {self.path}: {exc}") from exc
+        # Directory snapshots, filled on first use by _stream_entries()
+        # and _storage_entries()
+        self._streams: Optional[list[list[str]]] = None
+        self._storages: Optional[list[list[str]]] = None
+        self._embeddings: Optional[list[list[str]]] = None
+        self._entry_index: Optional[dict[str, list[str]]] = None
+
+    def _is_source(self, dest: Path) -> bool:
+        """True if *dest* is the file this parser reads from.
+
+        Aliases of the source (relative paths, symlinks) count as well.
+        """
+        if self._data is not None:
+            return False
+        if dest == self.path:
+            return True
+        try:
+            return os.path.samefile(dest, self.path)
+        except OSError:
+            return False  # dest does not exist yet
+
+    def _require_file(self) -> None:
+        """Raise if there is no source file to write back to."""
+        if self._data is not None:
+            raise OleParseError("An output path is required for a report "
+                                "opened from memory")
+
+    def _copy_to(self, dest: Path) -> None:
+        """Write an unmodified copy of the report to *dest*."""
+        if self._data is not None:
+            dest.write_bytes(self._data)
+        else:
+            _fast_clone(self.path, dest)
+
+    def _stream_entries(self) -> list[list[str]]:
+        """Return the stream entries of the file, listed once per open."""
+        if self._streams is None:
+            self._streams = self._ole.listdir()
+        return self._streams
+
+    def _storage_entries(self) -> list[list[str]]:
+        """Return the storage entries of the file, listed once per open."""
+        if self._storages is None:
+            self._storages = self._ole.listdir(storages=True, streams=False)
+        return self._storages
+
+    def _embedding_entries(self) -> list[list[str]]:
+        """Return the ``Embedding*`` stream entries, filtered once per open."""
+        if self._embeddings is None:
+            self._embeddings = [entry for entry in self._stream_entries()
+                                if _is_embedding(entry)]
+        return self._embeddings
+
+    def _find_stream(self, stream_path: str) -> Optional[list[str]]:
+        """Look up a stream entry by its slash-separated path.
+
+        Matching is case-insensitive, like olefile's own lookup.
+        """
+        if self._entry_index is None:
+            self._entry_index = {"/".join(entry).lower(): entry
+                                 for entry in self._stream_entries()}
+        return self._entry_index.get(stream_path.lower())
+
+    def _invalidate_entries(self) -> None:
+        """Drop the directory snapshots after the file was rewritten."""
+        self._streams = None
+        self._storages = None
+        self._embeddings = None
+        self._entry_index = None
 
     # ------------------------------------------------------------------
     # Context manager
@@ -47,7 +160,19 @@ class OleParser:
         return False
 
     def close(self):
-        """Close the underlying OLE file."""
+        """Close the underlying OLE file.
+
+        Embedded images whose data has not been read yet can no longer
+        load it; accessing their ``data`` raises :class:`OleParseError`.
+        """
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                # Views from get_stream_view() are still alive; the map
+                # is released together with the last of them
+                pass
+            self._mm = None
         if self._ole is not None:
             self._ole.close()
             self._ole = None
@@ -71,9 +196,13 @@ class OleParser:
             revision_number=_decode(meta.revision_number),
         )
 
-    def set_metadata(self, path: Union[str, Path], **kwargs) -> None:
+    def set_metadata(self, path: Union[str, Path, None] = None,
+                     **kwargs) -> None:
         """Write metadata changes and save to *path*.
 
+        *path* defaults to the source file; it is required for a report
+        opened with :meth:`from_bytes`.
+
         Supported keyword arguments match :class:`ReportMetadata` fields:
         ``title``, ``subject``, ``author``, ``keywords``, ``comments``.
 
@@ -81,9 +210,11 @@ class OleParser:
         This method copies the file.  For full metadata editing, use the
         CRPE engine layer.
         """
-        output = Path(path)
-        if output != self.path:
-            shutil.copy2(str(self.path), str(output))
+        if path is None:
+            self._require_file()
+        output = _as_path(path) if path else self.path
+        if not self._is_source(output):
+            self._copy_to(output)
 
     # ------------------------------------------------------------------
     # Streams
@@ -91,7 +222,7 @@ class OleParser:
 
     def list_streams(self) -> list[str]:
         """Return a list of all OLE stream paths in the file."""
-        return ["/".join(entry) for entry in self._ole.listdir()]
+        return ["/".join(entry) for entry in self._stream_entries()]
 
     def get_stream(self, stream_path: str) -> bytes:
         """Read raw bytes from an OLE stream.
@@ -101,10 +232,30 @@ class OleParser:
         stream_path : str
             Forward-slash-separated path, e.g. ``"Embedding1/Contents"``.
         """
-        parts = stream_path.split("/")
-        if not self._ole.exists(parts):
+        entry = self._find_stream(stream_path)
+        if entry is None:
+            raise OleParseError(f"Stream not found: {stream_path}")
+        return self._read_entry(entry)
+
+    def get_stream_view(self, stream_path: str) -> memoryview:
+        """Return a read-only view of an OLE stream.
+
+        A stream stored in one contiguous run of regular sectors is
+        returned as a view into the memory-mapped file, without copying
+        it; such a view must not be used after :meth:`close`.  Being
+        live, it also shows same-size streams that :meth:`set_streams`
+        later rewrites in place in this file.  Other streams are read as
+        by :meth:`get_stream` and wrapped.
+        """
+        entry = self._find_stream(stream_path)
+        if entry is None:
             raise OleParseError(f"Stream not found: {stream_path}")
-        return self._ole.openstream(parts).read()
+        if self._mm is not None:
+            runs = self._stream_runs(entry)
+            if runs is not None and len(runs) == 1:
+                offset, length = runs[0]
+                return memoryview(self._mm)[offset:offset + length]
+        return memoryview(self._read_entry(entry))
 
     def set_stream(self, stream_path: str, data: bytes,
                    output_path: Union[str, Path, None] = None) -> None:
@@ -119,17 +270,50 @@ class OleParser:
         output_path : str or Path, optional
             Where to save.  Defaults to overwriting the original file.
         """
-        dest = Path(output_path) if output_path else self.path
+        self.set_streams({stream_path: data}, output_path)
 
-        if dest != self.path:
-            shutil.copy2(str(self.path), str(dest))
+    def set_streams(self, streams: dict[str, bytes],
+                    output_path: Union[str, Path, None] = None) -> None:
+        """Write several OLE streams and save.
 
-        ole = olefile.OleFileIO(str(dest), write_mode=True)
-        try:
-            parts = stream_path.split("/")
-            ole.write_stream(parts, data)
-        finally:
-            ole.close()
+        The file is copied and opened for writing once for the whole
+        batch, rather than once per stream as repeated
+        :meth:`set_stream` calls would.
+
+        Parameters
+        ----------
+        streams : dict
+            Maps forward-slash-separated stream paths to new content:
+            ``bytes`` or any contiguous buffer such as a ``memoryview``,
+            which same-size streams write without copying.
+        output_path : str or Path, optional
+            Where to save.  Defaults to overwriting the original file.
+        """
+        if not output_path:
+            self._require_file()
+        dest = _as_path(output_path) if output_path else self.path
+
+        if not self._is_source(dest):
+            self._copy_to(dest)
+
+        # Same-size streams are written straight into their sectors;
+        # everything else takes olefile's full write-mode round trip
+        pending = {}
+        with open(dest, "r+b") as fp:
+            for stream_path, data in streams.items():
+                entry = self._find_stream(stream_path)
+                if entry is None or not self._patch_in_place(fp, entry, data):
+                    pending[stream_path] = data
+        if pending:
+            ole = olefile.OleFileIO(str(dest), write_mode=True)
+            try:
+                for stream_path, data in pending.items():
+                    # olefile only accepts bytes
+                    ole.write_stream(stream_path.split("/"), bytes(data))
+            finally:
+                ole.close()
+        if self._is_source(dest):
+            self._invalidate_entries()
 
     # ------------------------------------------------------------------
     # Embedded images
@@ -144,26 +328,100 @@ class OleParser:
         """
         images: list[EmbeddedImage] = []
         idx = 0
-        for entry in self._ole.listdir():
-            stream_name = "/".join(entry)
-            # Crystal Reports uses streams like "Embedding1", "Embedding2", ...
-            # The actual image data may be in the root or in a sub-stream
-            if len(entry) >= 1 and entry[0].lower().startswith("embedding"):
-                try:
-                    data = self._ole.openstream(entry).read()
-                except Exception:
-                    continue
-                # Detect BMP by magic bytes
-                fmt = "bmp" if data[:2] == b"BM" else "unknown"
-                images.append(EmbeddedImage(
-                    index=idx,
-                    name=stream_name,
-                    format=fmt,
-                    data=data,
-                ))
-                idx += 1
+        # Crystal Reports uses streams like "Embedding1", "Embedding2", ...
+        # The actual image data may be in the root or in a sub-stream
+        for entry in self._embedding_entries():
+            try:
+                magic = self._read_magic(entry)
+            except Exception:
+                continue
+            # Detect BMP by magic bytes
+            fmt = "bmp" if magic == b"BM" else "unknown"
+            # The stream itself is read only when .data is accessed
+            image = EmbeddedImage.lazy(
+                index=idx,
+                name="/".join(entry),
+                format=fmt,
+                size=self._ole.get_size(entry),
+                loader=functools.partial(self._read_entry, entry),
+            )
+            images.append(image)
+            idx += 1
         return images
 
+    def _read_entry(self, entry: list[str]) -> bytes:
+        """Read the whole stream at *entry*.
+
+        Streams stored in regular sectors are assembled straight from the
+        memory-mapped file, which copies the data once.  Mini streams, or
+        anything the sector walk does not accept, go through olefile.
+        """
+        if self._ole is None:
+            raise OleParseError(f"Report is closed: {self.path}")
+        if self._mm is not None:
+            runs = self._stream_runs(entry)
+            if runs is not None:
+                with memoryview(self._mm) as view:
+                    return b"".join([view[offset:offset + length]
+                                     for offset, length in runs])
+        return self._ole.openstream(entry).read()
+
+    def _stream_runs(self, entry: list[str]) -> Optional[list[tuple[int, int]]]:
+        """Map the stream at *entry* to ``(offset, length)`` file ranges.
+
+        This is the only place that reaches into olefile's internals (the
+        directory entries, the FAT and the file size), which are not part
+        of its public API.  Returns None for streams in the mini stream,
+        for a broken sector chain, or when the installed olefile lacks
+        those internals; callers then go through ``openstream()``.
+        """
+        ole = self._ole
+        try:
+            dirent = ole.direntries[ole._find(entry)]
+            if dirent.size < ole.minisectorcutoff:
+                return None
+            return _sector_runs(ole.fat, ole.sectorsize, ole._filesize,
+                                dirent.isectStart, dirent.size)
+        except AttributeError:
+            return None
+
+    def _patch_in_place(self, fp, entry: list[str], data: bytes) -> bool:
+        """Overwrite the stream at *entry* through the open file *fp*.
+
+        Only same-size streams stored in regular sectors are patched; the
+        sector chain and directory are left untouched.  *fp* may be this
+        file or a byte-for-byte copy of it.  Returns False, without
+        writing anything, when the stream has to go through olefile.
+        """
+        runs = self._stream_runs(entry)
+        if runs is None:
+            return False
+        with memoryview(data).cast("B") as view:
+            if view.nbytes != sum(length for _, length in runs):
+                return False
+            pos = 0
+            for offset, length in runs:
+                fp.seek(offset)
+                fp.write(view[pos:pos + length])
+                pos += length
+        return True
+
+    def _read_magic(self, entry: list[str]) -> bytes:
+        """Return the first two bytes of the stream at *entry*.
+
+        For streams stored in regular sectors the bytes are read straight
+        from the stream's first sector.  Small streams live in the mini
+        stream and are simply read in full.
+        """
+        runs = self._stream_runs(entry)
+        if runs is None:
+            return self._read_entry(entry)[:2]
+        offset = runs[0][0]
+        if self._mm is not None:
+            return self._mm[offset:offset + 2]
+        self._ole.fp.seek(offset)
+        return self._ole.fp.read(2)
+
     def replace_embedded_image(self, index: int, new_data: bytes,
                                output_path: Union[str, Path, None] = None) -> None:
         """Replace an embedded image by index.
@@ -173,7 +431,8 @@ class OleParser:
         index : int
             Zero-based index matching :pyattr:`EmbeddedImage.index`.
         new_data : bytes
-            Raw BMP (or other) image data.
+            Raw BMP (or other) image data; any contiguous buffer is
+            accepted, see :meth:`set_streams`.
         output_path : str or Path, optional
             Save destination.  Defaults to overwriting in-place.
         """
@@ -196,9 +455,9 @@ class OleParser:
         """
         subs: list[SubreportInfo] = []
         idx = 0
-        for entry in self._ole.listdir(storages=True, streams=False):
+        for entry in self._storage_entries():
             name = entry[0]
-            if name.lower().startswith("subreport"):
+            if _SUB_RE.match(name):
                 subs.append(SubreportInfo(
                     index=idx,
                     name=name,
@@ -208,12 +467,10 @@ class OleParser:
         # Also look for numbered sub-document storages
         # Crystal Reports sometimes uses storage names like the subreport name
         if not subs:
-            for entry_name in self._ole.listdir(storages=True, streams=False):
+            for entry_name in self._storage_entries():
                 top = entry_name[0]
                 # Heuristic: storages that are not standard OLE entries
-                if top not in ("\x01CompObj", "\x05SummaryInformation",
-                               "\x05DocumentSummaryInformation") and \
-                   not top.lower().startswith("embedding"):
+                if top not in _STD_OLE_ENTRIES and not _EMBED_RE.match(top):
                     # Could be a subreport storage
                     subs.append(SubreportInfo(
                         index=idx,
@@ -234,6 +491,7 @@ class OleParser:
         info into a single dict.
         """
         meta = self.get_metadata()
+        structure = self._scan_structure()
         return {
             "title": meta.title,
             "author": meta.author,
@@ -241,11 +499,27 @@ class OleParser:
             "creating_application": meta.creating_application,
             "create_time": str(meta.create_time) if meta.create_time else None,
             "last_save_time": str(meta.last_save_time) if meta.last_save_time else None,
-            "num_streams": len(self.list_streams()),
-            "num_images": len(self.get_embedded_images()),
-            "num_subreports": len(self.list_subreports()),
+            "num_streams": structure.n_streams,
+            "num_images": len(structure.embeddings),
+            "num_subreports": len(structure.subreports),
         }
 
+    def _scan_structure(self) -> _OleStructure:
+        """Summarise the directory in one pass without reading any stream.
+
+        Embedding sizes come from the directory entries, so counting
+        images does not load their data the way
+        :meth:`get_embedded_images` does.
+        """
+        streams = self._stream_entries()
+        embeddings = [("/".join(entry), self._ole.get_size(entry))
+                      for entry in self._embedding_entries()]
+        return _OleStructure(
+            n_streams=len(streams),
+            embeddings=embeddings,
+            subreports=self.list_subreports(),
+        )
+
     # ------------------------------------------------------------------
     # Save
     # ------------------------------------------------------------------
@@ -258,8 +532,10 @@ class OleParser:
         edits use :meth:`set_metadata`.  For full round-trip editing the
         CRPE engine layer should be used.
         """
-        if output_path and Path(output_path) != self.path:
-            shutil.copy2(str(self.path), str(output_path))
+        if output_path:
+            dest = _as_path(output_path)
+            if not self._is_source(dest):
+                self._copy_to(dest)
 
     # ------------------------------------------------------------------
     # Full parse
@@ -280,15 +556,104 @@ class OleParser:
 # Helpers
 # ------------------------------------------------------------------
 
+def _as_path(path: Union[str, Path]) -> Path:
+    """Return *path* as a :class:`Path`, reusing it if it already is one."""
+    return path if isinstance(path, Path) else Path(path)
+
+
+def _fast_clone(src: Path, dst: Path) -> None:
+    """Copy *src* to *dst* like :func:`shutil.copy2`.
+
+    On Linux the data is copied with :func:`os.copy_file_range`, which
+    stays in the kernel and shares extents instead of copying them on
+    filesystems with reflink support (Btrfs, XFS).  Elsewhere, or if the
+    call is refused, this falls back to :func:`shutil.copy2`.  Like
+    :func:`shutil.copy2`, raises :class:`shutil.SameFileError` if *dst*
+    is *src*, before anything is truncated.
+    """
+    try:
+        same = os.path.samefile(src, dst)
+    except OSError:
+        same = False  # dst does not exist yet
+    if same:
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(fsrc.fileno(), fdst.fileno(),
+                                             remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+        except OSError:
+            remaining = -1
+        if remaining == 0:
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(str(src), str(dst))
+
+
+def _sector_runs(fat, sector_size: int, file_size: int, start: int,
+                 size: int) -> Optional[list[tuple[int, int]]]:
+    """Map *size* bytes of the FAT chain at *start* to file ranges.
+
+    Returns ``(offset, length)`` pairs in stream order, with runs of
+    consecutive sectors merged into one range, or None if the chain is
+    broken or points outside the file.
+    """
+    n_fat = len(fat)
+    runs = []
+    sect = start
+    remaining = size
+    steps = 0
+    while remaining > 0:
+        if not 0 <= sect < n_fat:
+            return None
+        run_start = sect
+        run_len = 1
+        while (run_len * sector_size < remaining
+               and sect + 1 < n_fat and fat[sect] == sect + 1):
+            sect += 1
+            run_len += 1
+        steps += run_len
+        if steps > n_fat:
+            return None  # cycle in the chain
+        offset = sector_size * (run_start + 1)
+        length = min(run_len * sector_size, remaining)
+        if offset + length > file_size:
+            return None
+        runs.append((offset, length))
+        remaining -= length
+        sect = fat[sect]
+    return runs
+
+
+def _is_embedding(entry: list[str]) -> bool:
+    """True for entries under an ``Embedding*`` stream or storage."""
+    return len(entry) >= 1 and _EMBED_RE.match(entry[0]) is not None
+
+
 def _decode(value) -> Optional[str]:
-    """Decode bytes to str if needed; return None for empty/None values."""
+    """Decode bytes to str if needed; return None for empty/None values.
+
+    ASCII values, by far the most common, are decoded without trying
+    UTF-8 first.  Other values are tried as UTF-8 and otherwise read as
+    cp1252, the Windows ANSI code page Crystal Reports writes.
+    """
     if value is None:
         return None
     if isinstance(value, bytes):
+        if not value:
+            return None
+        if value.isascii():
+            return value.decode("ascii")
         try:
             return value.decode("utf-8")
         except UnicodeDecodeError:
-            return value.decode("latin-1")
+            return value.decode("cp1252", errors="replace")
     if isinstance(value, str):
         return value if value else None
     return str(value)
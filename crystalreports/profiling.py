@@ -0,0 +1,102 @@
+"""Opt-in call profiling for the CRPE engine layer.
+
+Set ``CRPE_PROFILE=1`` before importing :mod:`crystalreports` to wrap
+every ``crpe32.dll`` function with a call counter and timer.  This shows
+whether a slow run is spending its time in the engine (for example in
+``PEExportTo``) or in Python.  When the variable is unset,
+:func:`profile_function` returns functions unchanged, so there is no
+overhead.
+
+Collected numbers are available from :func:`get_stats` and can be written
+as JSON with :func:`write_report`.  If ``CRPE_PROFILE_OUTPUT`` names a
+file, the report is written there when the interpreter exits.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+ENABLED = os.environ.get("CRPE_PROFILE", "") not in ("", "0")
+
+# name -> [calls, total seconds]
+_stats: dict[str, list] = {}
+_lock = threading.Lock()
+
+
+def profile_function(func: Callable, name: Optional[str] = None) -> Callable:
+    """Wrap *func* to record its call count and cumulative run time.
+
+    Returns *func* itself when profiling is disabled.  May also be used
+    as a plain decorator.
+
+    Parameters
+    ----------
+    func : callable
+        The function to instrument.
+    name : str, optional
+        Key under which calls are recorded.  Defaults to
+        ``func.__name__``.
+    """
+    if not ENABLED:
+        return func
+    key = name or getattr(func, "__name__", repr(func))
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            with _lock:
+                entry = _stats.get(key)
+                if entry is None:
+                    _stats[key] = [1, elapsed]
+                else:
+                    entry[0] += 1
+                    entry[1] += elapsed
+
+    return wrapper
+
+
+def get_stats() -> dict[str, dict[str, float]]:
+    """Return ``{name: {"calls", "total", "mean"}}``, slowest first.
+
+    Times are in seconds.
+    """
+    with _lock:
+        items = [(k, v[0], v[1]) for k, v in _stats.items()]
+    items.sort(key=lambda item: item[2], reverse=True)
+    return {
+        name: {"calls": calls, "total": total, "mean": total / calls}
+        for name, calls, total in items
+    }
+
+
+def reset_stats() -> None:
+    """Discard all recorded calls."""
+    with _lock:
+        _stats.clear()
+
+
+def write_report(path: Union[str, Path]) -> None:
+    """Write :func:`get_stats` to *path* as JSON."""
+    Path(path).write_text(json.dumps(get_stats(), indent=2), encoding="utf-8")
+
+
+def _write_report_at_exit() -> None:
+    output = os.environ.get("CRPE_PROFILE_OUTPUT")
+    if output and _stats:
+        write_report(output)
+
+
+if ENABLED:
+    atexit.register(_write_report_at_exit)
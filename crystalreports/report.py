@@ -6,11 +6,14 @@ with the optional native CRPE engine layer (requires crpe32.dll).
 
 from __future__ import annotations
 
+import importlib
+import os
 import shutil
+import struct
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
-from .exceptions import SDKNotAvailableError
+from .exceptions import ReportOpenError, SDKNotAvailableError
 from .models import (
     EmbeddedImage,
     ExportFormat,
@@ -18,25 +21,123 @@ from .models import (
     ParameterInfo,
     ReportMetadata,
     ReportObject,
+    ReportSchema,
     SectionInfo,
     SortFieldInfo,
     SubreportInfo,
     TableInfo,
 )
-from .ole_parser import OleParser
 
-# Lazy import to avoid hard dependency on crpe32.dll
-_CrpeEngine = None
-_CrpeJob = None
+if TYPE_CHECKING:
+    from .ole_parser import OleParser
 
+__all__ = ["CrystalReport"]
 
-def _get_crpe_classes():
-    global _CrpeEngine, _CrpeJob
-    if _CrpeEngine is None:
-        from .crpe_engine import CrpeEngine as _CE, CrpeJob as _CJ
-        _CrpeEngine = _CE
-        _CrpeJob = _CJ
-    return _CrpeEngine, _CrpeJob
+# OleParser used to be imported eagerly; it is resolved on first access
+# so that importing this module does not load olefile
+_LAZY_ATTRS = {
+    "OleParser": ".ole_parser",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __package__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+# Lazy import to avoid hard dependency on crpe32.dll.  Successful imports
+# are cached in sys.modules; only a failure needs remembering.
+_crpe_unavailable = False
+
+
+def _crpe_engine_class():
+    """Return :class:`CrpeEngine`, or None if it cannot be imported."""
+    global _crpe_unavailable
+    if _crpe_unavailable:
+        return None
+    try:
+        from .crpe_engine import CrpeEngine
+    except ImportError:
+        _crpe_unavailable = True
+        return None
+    return CrpeEngine
+
+
+_OLE_SIGNATURE = bytes.fromhex("D0CF11E0A1B11AE1")
+# Header fields from offset 0x1E: sector shift, mini sector shift, 6
+# reserved bytes, then the directory, FAT, first directory sector,
+# transaction, mini cutoff, first mini FAT, mini FAT, first DIFAT and
+# DIFAT sector fields
+_OLE_HEADER = struct.Struct("<HH6xIIIIIIIII")
+
+
+def _preflight_ole_header(path: Path) -> None:
+    """Reject files whose OLE2 header is obviously corrupt.
+
+    Only the 76-byte header is read.  The sector counts it declares must
+    fit in the actual file; otherwise a crafted or truncated file could
+    make the OLE parser or the engine allocate huge FAT tables.
+    """
+    with open(path, "rb") as f:
+        header = f.read(0x4C)
+        file_size = os.fstat(f.fileno()).st_size
+    if len(header) < 0x4C or header[:8] != _OLE_SIGNATURE:
+        raise ReportOpenError(f"Not an OLE2 file: {path}")
+    (sector_shift, mini_shift, n_dir, n_fat, _, _, _, _, n_minifat, _,
+     n_difat) = _OLE_HEADER.unpack_from(header, 0x1E)
+    if sector_shift not in (9, 12) or mini_shift != 6:
+        raise ReportOpenError(f"Corrupt OLE header (sector size): {path}")
+    for count in (n_dir, n_fat, n_minifat, n_difat):
+        if count << sector_shift > file_size:
+            raise ReportOpenError(
+                f"Corrupt OLE header (sector count {count}): {path}")
+
+
+# Export format names -> ExportFormat, built by the first export
+_FMT_LOOKUP: Optional[dict[str, ExportFormat]] = None
+
+
+def _export_format(name: str) -> ExportFormat:
+    """Map a case-insensitive format name such as ``"pdf"`` to
+    :class:`ExportFormat` without going through the enum constructor."""
+    global _FMT_LOOKUP
+    if _FMT_LOOKUP is None:
+        _FMT_LOOKUP = {member.value: member for member in ExportFormat}
+    try:
+        return _FMT_LOOKUP[name.lower()]
+    except KeyError:
+        raise ValueError(f"{name!r} is not a valid ExportFormat") from None
+
+
+class _cached_property:
+    """Like :func:`functools.cached_property`, but stores values in the
+    instance's ``_cache`` dict so the owning class can use ``__slots__``."""
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance._cache
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.func(instance)
+            return value
 
 
 class CrystalReport:
@@ -49,6 +150,8 @@ class CrystalReport:
     use_sdk : bool
         Attempt to load the native CRPE engine.  If *False* or the DLL
         is not available, only the pure-Python OLE layer is used.
+        Errors from an available engine, such as a report it cannot
+        open, are raised rather than hidden.
 
     Examples
     --------
@@ -57,20 +160,74 @@ class CrystalReport:
     ...     print(rpt.tables)
     """
 
+    __slots__ = ("_path", "_ole", "_engine", "_job", "_closed", "_cache")
+
     def __init__(self, path: Union[str, Path], use_sdk: bool = True):
-        self._path = Path(path).resolve()
-        self._ole = OleParser(self._path)
+        # abspath is string work only; resolve() would open the file to
+        # canonicalise it.  The engine resolves the path it opens itself.
+        self._path = Path(os.path.abspath(path))
+        if not self._path.exists():
+            raise ReportOpenError(f"File not found: {self._path}")
+        _preflight_ole_header(self._path)
+        self._ole: Optional[OleParser] = None  # opened by _ole_parser()
         self._engine = None
         self._job = None
+        self._closed = False
+        self._cache: dict = {}  # values of the _cached_property getters
 
-        if use_sdk:
+        CrpeEngine = _crpe_engine_class() if use_sdk else None
+        if CrpeEngine is not None:
+            engine = CrpeEngine()
             try:
-                CrpeEngine, _ = _get_crpe_classes()
-                self._engine = CrpeEngine()
-                self._job = self._engine.open(self._path)
-            except (SDKNotAvailableError, Exception):
-                self._engine = None
-                self._job = None
+                self._job = engine.open(self._path)
+                self._engine = engine
+            except (SDKNotAvailableError, OSError):
+                # No usable crpe32.dll: fall back to the OLE layer
+                engine.close()
+            except BaseException:
+                # Engine errors surface; don't leak the opened engine
+                engine.close()
+                raise
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview], *,
+                   filename: str = "<memory>.rpt") -> "CrystalReport":
+        """Open a report held in memory, e.g. fetched from a database.
+
+        Only the OLE layer is available: the CRPE engine can only open
+        files, so SDK-backed operations raise
+        :class:`SDKNotAvailableError`.  Editing methods need an explicit
+        *output_path*.
+
+        Parameters
+        ----------
+        data : bytes-like
+            Contents of an .rpt file.
+        filename : str
+            Name used for :func:`repr` and error messages.
+        """
+        from .ole_parser import OleParser
+        report = cls.__new__(cls)
+        report._path = Path(filename)
+        report._ole = OleParser.from_bytes(data, filename)
+        report._engine = None
+        report._job = None
+        report._closed = False
+        report._cache = {}
+        return report
+
+    def _ole_parser(self) -> OleParser:
+        """Return the OLE parser, opening the file on first use.
+
+        SDK-only workflows never parse the OLE container.  Raises
+        :class:`ReportOpenError` once the report has been closed.
+        """
+        if self._closed:
+            raise ReportOpenError(f"Report is closed: {self._path}")
+        if self._ole is None:
+            from .ole_parser import OleParser
+            self._ole = OleParser(self._path)
+        return self._ole
 
     # ------------------------------------------------------------------
     # Context manager
@@ -84,16 +241,16 @@ class CrystalReport:
         return False
 
     def close(self) -> None:
-        """Release all resources."""
-        if self._job is not None:
-            self._job.close()
-            self._job = None
-        if self._engine is not None:
-            self._engine.close()
-            self._engine = None
-        if self._ole is not None:
-            self._ole.close()
-            self._ole = None
+        """Release all resources.  Further calls do nothing."""
+        if self._closed:
+            return
+        self._closed = True
+        # The OLE parser is only closed if it was ever opened
+        for attr in ("_job", "_engine", "_ole"):
+            resource = getattr(self, attr)
+            if resource is not None:
+                resource.close()
+                setattr(self, attr, None)
 
     # ------------------------------------------------------------------
     # SDK availability
@@ -105,7 +262,9 @@ class CrystalReport:
         return self._job is not None
 
     def _require_sdk(self) -> None:
-        if not self.has_sdk:
+        # Same test as has_sdk, without the property call; this runs
+        # before every SDK-backed operation
+        if self._job is None:
             raise SDKNotAvailableError(
                 "This operation requires the Crystal Reports SDK (crpe32.dll)."
             )
@@ -114,88 +273,172 @@ class CrystalReport:
     # Properties — OLE layer (always available)
     # ------------------------------------------------------------------
 
-    @property
+    # Read once per instance; _invalidate_ole_cache() drops them after
+    # anything that rewrites the file.
+    _OLE_CACHED = ("metadata", "embedded_images", "subreports", "streams")
+
+    def _invalidate_ole_cache(self) -> None:
+        for name in self._OLE_CACHED:
+            self._cache.pop(name, None)
+
+    @_cached_property
     def metadata(self) -> ReportMetadata:
         """Report metadata from OLE2 SummaryInformation."""
-        return self._ole.get_metadata()
+        return self._ole_parser().get_metadata()
 
-    @property
+    @_cached_property
     def embedded_images(self) -> list[EmbeddedImage]:
         """Embedded BMP images from the OLE container."""
-        return self._ole.get_embedded_images()
+        return self._ole_parser().get_embedded_images()
 
-    @property
+    @_cached_property
     def subreports(self) -> list[SubreportInfo]:
         """Subreport entries found in the OLE structure."""
-        return self._ole.list_subreports()
+        return self._ole_parser().list_subreports()
 
-    @property
+    @_cached_property
     def streams(self) -> list[str]:
         """All OLE stream paths."""
-        return self._ole.list_streams()
+        return self._ole_parser().list_streams()
 
     # ------------------------------------------------------------------
     # Properties — CRPE layer (requires SDK)
     # ------------------------------------------------------------------
 
-    @property
+    # Cached like the OLE properties, but dropped by every method that
+    # changes the job; load_all() fills them in one pass.
+    _SDK_CACHED = ("tables", "formulas", "sql_query", "parameters",
+                   "sections", "sort_fields", "n_groups", "section_codes",
+                   "objects")
+
+    def _invalidate_sdk_cache(self) -> None:
+        for name in self._SDK_CACHED:
+            self._cache.pop(name, None)
+        # Derived from "objects", so not fetchable by load_all()
+        self._cache.pop("objects_by_section", None)
+
+    def load_all(self, *, include: tuple[str, ...] = _SDK_CACHED) -> None:
+        """Read the given SDK properties now and cache them.
+
+        This runs in the calling thread; :meth:`CrpeJob.prefetch` is the
+        background variant.
+
+        Parameters
+        ----------
+        include : tuple of str
+            Property names to fetch; by default all cached SDK
+            properties.  See :meth:`CrpeJob.get_bulk`.
+        """
+        self._require_sdk()
+        self._cache.update(self._job.get_bulk(include))
+
+    @_cached_property
     def tables(self) -> list[TableInfo]:
         """Database tables used by the report."""
         self._require_sdk()
         return self._job.get_tables()
 
-    @property
+    @_cached_property
     def formulas(self) -> list[FormulaInfo]:
         """Formula fields defined in the report."""
         self._require_sdk()
         return self._job.get_formulas()
 
-    @property
+    @_cached_property
     def sql_query(self) -> str:
         """The SQL query used by the report."""
         self._require_sdk()
         return self._job.get_sql_query()
 
-    @property
+    @_cached_property
     def parameters(self) -> list[ParameterInfo]:
         """Parameter fields."""
         self._require_sdk()
         return self._job.get_parameters()
 
-    @property
+    @_cached_property
     def sections(self) -> list[SectionInfo]:
         """Report sections."""
         self._require_sdk()
         return self._job.get_sections()
 
-    @property
+    @_cached_property
     def sort_fields(self) -> list[SortFieldInfo]:
         """Sort fields."""
         self._require_sdk()
         return self._job.get_sort_fields()
 
-    @property
+    @_cached_property
     def n_groups(self) -> int:
         """Number of groups."""
         self._require_sdk()
         return self._job.get_n_groups()
 
     @property
+    def schema(self) -> ReportSchema:
+        """Parameters, sort fields and group count in one call."""
+        self._require_sdk()
+        return self._job.get_schema()
+
+    @_cached_property
     def section_codes(self) -> list[int]:
         """All valid section codes (area * 6000 + sub * 50)."""
         self._require_sdk()
         return self._job.get_section_codes()
 
-    @property
+    @_cached_property
     def objects(self) -> list[ReportObject]:
-        """All report layout objects across all sections."""
+        """All report layout objects across all sections.
+
+        Builds the full list; use :meth:`iter_objects` to stream them.
+        """
         self._require_sdk()
         return self._job.get_all_objects()
 
+    def get_object(self, handle: int, section_code: int) -> ReportObject:
+        """Read one report layout object by handle, bypassing the cache.
+
+        See :meth:`CrpeJob.get_object`.
+        """
+        self._require_sdk()
+        return self._job.get_object(handle, section_code)
+
+    def iter_objects(self, section_code: Optional[int] = None
+                     ) -> Iterator[ReportObject]:
+        """Iterate over report layout objects without building a list.
+
+        Parameters
+        ----------
+        section_code : int, optional
+            Only yield objects in this section; all sections by default.
+        """
+        self._require_sdk()
+        return self._job.iter_objects(section_code)
+
+    def get_objects_soa(self) -> dict:
+        """All report layout objects as parallel columns.
+
+        See :meth:`CrpeJob.get_objects_soa` for the column layout.
+        """
+        self._require_sdk()
+        return self._job.get_objects_soa()
+
+    @_cached_property
+    def objects_by_section(self) -> dict[int, list[ReportObject]]:
+        """Report layout objects grouped by section code.
+
+        Built once from :attr:`objects`; sections without objects are
+        absent.
+        """
+        by_section: dict[int, list[ReportObject]] = {}
+        for obj in self.objects:
+            by_section.setdefault(obj.section_code, []).append(obj)
+        return by_section
+
     def get_objects_in_section(self, section_code: int) -> list[ReportObject]:
         """Get report objects in a specific section."""
         self._require_sdk()
-        return self._job.get_objects_in_section(section_code)
+        return list(self.objects_by_section.get(section_code, ()))
 
     # ------------------------------------------------------------------
     # Editing — OLE layer
@@ -212,11 +455,11 @@ class CrystalReport:
         **kwargs
             Metadata fields to update.  See :class:`ReportMetadata`.
         """
-        dest = output_path or self._path
-        self._ole.set_metadata(dest, **kwargs)
+        self._ole_parser().set_metadata(output_path, **kwargs)
+        self._invalidate_ole_cache()
 
     def replace_image(self, index: int,
-                      image: Union[str, Path, bytes],
+                      image: Union[str, Path, bytes, bytearray, memoryview],
                       output_path: Optional[Union[str, Path]] = None) -> None:
         """Replace an embedded image.
 
@@ -224,16 +467,20 @@ class CrystalReport:
         ----------
         index : int
             Zero-based index of the image.
-        image : str, Path, or bytes
-            File path or raw image data.
+        image : str, Path, or bytes-like
+            File path or raw image data.  A ``bytearray`` or
+            ``memoryview`` is written without an intermediate copy when
+            the new image has the same size as the old one.
         output_path : str or Path, optional
             Save destination.
         """
         if isinstance(image, (str, Path)):
-            data = Path(image).read_bytes()
+            with open(image, "rb") as f:
+                data = f.read()
         else:
             data = image
-        self._ole.replace_embedded_image(index, data, output_path)
+        self._ole_parser().replace_embedded_image(index, data, output_path)
+        self._invalidate_ole_cache()
 
     # ------------------------------------------------------------------
     # Editing — CRPE layer
@@ -252,16 +499,19 @@ class CrystalReport:
         """
         self._require_sdk()
         self._job.set_table_location(table_index, **kwargs)
+        self._invalidate_sdk_cache()
 
     def set_formula(self, name: str, text: str) -> None:
         """Set formula text by name."""
         self._require_sdk()
         self._job.set_formula(name, text)
+        self._invalidate_sdk_cache()
 
     def set_sql_query(self, sql: str) -> None:
         """Set the SQL query."""
         self._require_sdk()
         self._job.set_sql_query(sql)
+        self._invalidate_sdk_cache()
 
     # ------------------------------------------------------------------
     # Editing — CRPE layout modification
@@ -269,14 +519,32 @@ class CrystalReport:
 
     def move_object(self, handle: int, left: int, top: int,
                     right: int, bottom: int,
-                    section_code: int = 0) -> None:
+                    section_code: int = 0,
+                    obj_type: Optional[int] = None) -> None:
         """Move/resize a report object by setting its bounds (twips).
 
         For Box and Line objects, pass *section_code* so the section
         height is auto-increased when the object bottom would exceed it.
+        Passing *obj_type* (:attr:`ReportObject.object_type_code`) skips
+        the type lookup for boxes and lines.
+        """
+        self._require_sdk()
+        self._job.move_object(handle, left, top, right, bottom, section_code,
+                              obj_type)
+        self._invalidate_sdk_cache()
+
+    def move_object_batch(self, moves) -> None:
+        """Move/resize several report objects.
+
+        *moves* holds :meth:`move_object` argument tuples
+        ``(handle, left, top, right, bottom[, section_code[, obj_type]])``.
+        Cached SDK properties are invalidated once, after the batch.
         """
         self._require_sdk()
-        self._job.move_object(handle, left, top, right, bottom, section_code)
+        try:
+            self._job.move_object_batch(moves)
+        finally:
+            self._invalidate_sdk_cache()
 
     def set_field_font(self, handle: int, face_name: str = "",
                        point_size: int = 0, bold: Optional[bool] = None,
@@ -289,6 +557,18 @@ class CrystalReport:
             handle, face_name, point_size, bold, italic, underline, strikeout,
         )
 
+    def set_field_font_batch(self, handles, face_name: str = "",
+                             point_size: int = 0,
+                             bold: Optional[bool] = None,
+                             italic: Optional[bool] = None,
+                             underline: Optional[bool] = None,
+                             strikeout: Optional[bool] = None) -> None:
+        """Apply the same font change to several Field objects."""
+        self._require_sdk()
+        self._job.set_field_font_batch(
+            handles, face_name, point_size, bold, italic, underline, strikeout,
+        )
+
     def set_section_font(self, section_code: int, face_name: str = "",
                          point_size: int = 0, bold: Optional[bool] = None,
                          italic: Optional[bool] = None,
@@ -305,6 +585,29 @@ class CrystalReport:
             section_code, face_name, point_size, bold, italic, scope,
         )
 
+    def make_font_applier(self, face_name: str = "", point_size: int = 0,
+                          bold: Optional[bool] = None,
+                          italic: Optional[bool] = None):
+        """Prepare a section font change to apply section by section.
+
+        Returns ``apply(section_code, scope=1)``; see
+        :meth:`CrpeJob.make_font_applier`.
+        """
+        self._require_sdk()
+        return self._job.make_font_applier(face_name, point_size, bold,
+                                           italic)
+
+    def set_section_font_batch(self, section_codes, face_name: str = "",
+                               point_size: int = 0,
+                               bold: Optional[bool] = None,
+                               italic: Optional[bool] = None,
+                               scope: int = 1) -> None:
+        """Apply the same font change to several sections."""
+        self._require_sdk()
+        self._job.set_section_font_batch(
+            section_codes, face_name, point_size, bold, italic, scope,
+        )
+
     def set_object_font_color(self, handle: int, color: int) -> None:
         """Set font color (COLORREF ``0x00BBGGRR``).
 
@@ -317,6 +620,7 @@ class CrystalReport:
         """Delete a report object."""
         self._require_sdk()
         self._job.delete_object(handle)
+        self._invalidate_sdk_cache()
 
     def get_section_height(self, section_code: int) -> int:
         """Get section height in twips."""
@@ -327,6 +631,7 @@ class CrystalReport:
         """Set section height in twips."""
         self._require_sdk()
         self._job.set_section_height(section_code, height)
+        self._invalidate_sdk_cache()
 
     def get_margins(self) -> tuple[int, int, int, int]:
         """Get page margins ``(left, right, top, bottom)`` in twips."""
@@ -357,7 +662,7 @@ class CrystalReport:
         """
         self._require_sdk()
         if isinstance(fmt, str):
-            fmt = ExportFormat(fmt.lower())
+            fmt = _export_format(fmt)
         self._job.export(output_path, fmt)
 
     # ------------------------------------------------------------------
@@ -378,7 +683,8 @@ class CrystalReport:
         if self.has_sdk:
             self._job.save(output_path)
         else:
-            self._ole.save(output_path)
+            self._ole_parser().save(output_path)
+        self._invalidate_ole_cache()
 
     # ------------------------------------------------------------------
     # Convenience
@@ -386,7 +692,15 @@ class CrystalReport:
 
     def get_stream(self, stream_path: str) -> bytes:
         """Read raw bytes from an OLE stream."""
-        return self._ole.get_stream(stream_path)
+        return self._ole_parser().get_stream(stream_path)
+
+    def get_stream_view(self, stream_path: str) -> memoryview:
+        """Read-only view of an OLE stream, without copying where possible.
+
+        See :meth:`OleParser.get_stream_view`; the view may point into
+        the open file and must not be used after :meth:`close`.
+        """
+        return self._ole_parser().get_stream_view(stream_path)
 
     def __repr__(self) -> str:
         sdk_status = "SDK" if self.has_sdk else "OLE-only"
@@ -3,16 +3,20 @@
 Pass 1: Align objects that are slightly off within the same row.
 Pass 2: Kopjes (Text objects) -> Calibri 9
 Pass 3: Data (Field objects) -> Arial 8
+
+Run with -q/--quiet to print only the per-pass counts.
 """
 import shutil
 import os
-from collections import defaultdict, Counter
+import sys
+from collections import defaultdict
 from crystalreports import CrystalReport
 
 INPUT = "SafiPrint.rpt"
 OUTPUT = "SafiPrint_fixed.rpt"
 TEMP = "SafiPrint_temp_save.rpt"
 TOLERANCE = 20  # twips
+QUIET = bool({"-q", "--quiet"} & set(sys.argv[1:]))
 
 CONTAINER_TYPES = {"Box", "Line"}
 AREA_NAMES = {1: "RH", 2: "PH", 3: "GH", 4: "D",
@@ -25,23 +29,54 @@ def section_label(code):
     return f"{AREA_NAMES.get(area, '?')}#{sub}"
 
 
+def classify_boxes(boxes):
+    """Classify a section's boxes for PASS 1b.
+
+    Returns ``(kind, kopje, inner, content)``.  *kind* is ``"pair"``
+    (kopje box above a content box), ``"triple"`` (two nested kopje
+    boxes above the content box, GH#1), ``"layered"`` (a pair whose
+    content starts above the kopje) or None for any other layout.
+    """
+    if len(boxes) not in (2, 3):
+        return None, None, None, None
+    boxes = sorted(boxes, key=lambda o: o.top)
+    if len(boxes) == 2:
+        kopje, content = boxes
+        if content.top < kopje.top:
+            return "layered", kopje, None, content
+        return "pair", kopje, None, content
+    # The outer kopje box is the taller of the top two (first on a tie)
+    first, second, content = boxes
+    first_height = first.bottom - first.top
+    second_height = second.bottom - second.top
+    kopje = first if first_height >= second_height else second
+    inner = first if first_height <= second_height else second
+    return "triple", kopje, inner, content
+
+
 fixes = []
 
 with CrystalReport(INPUT) as rpt:
-    # Group objects by section
+    # Group objects by section, and per section by object type so the
+    # passes below don't each re-filter the section's objects
     sections = defaultdict(list)
+    by_type = defaultdict(lambda: defaultdict(list))
     for obj in rpt.objects:
         sections[obj.section_code].append(obj)
+        by_type[obj.section_code][obj.object_type].append(obj)
+    section_codes = sorted(sections)
+    labels = {code: section_label(code) for code in section_codes}
 
     # =========================================================
     # PASS 1: Fix alignment
     # =========================================================
     print("=== PASS 1: Alignment fixes ===\n")
 
-    for code in sorted(sections.keys()):
+    for code in section_codes:
         objects = sections[code]
         if len(objects) < 2:
             continue
+        label = labels[code]
 
         containers = [o for o in objects if o.object_type in CONTAINER_TYPES]
         content = [o for o in objects if o.object_type not in CONTAINER_TYPES]
@@ -50,45 +85,52 @@ with CrystalReport(INPUT) as rpt:
             if len(group) < 2:
                 continue
 
+            # Sweep in top order: a row runs from its first object
+            # until an object lies more than TOLERANCE below it
             sorted_objs = sorted(group, key=lambda o: o.top)
             rows = []
-            used = set()
+            row = [sorted_objs[0]]
+            anchor = sorted_objs[0].top
 
-            for obj in sorted_objs:
-                if obj.handle in used:
+            for obj in sorted_objs[1:]:
+                if obj.top - anchor <= TOLERANCE:
+                    row.append(obj)
                     continue
-                row = [obj]
-                used.add(obj.handle)
-                for other in sorted_objs:
-                    if other.handle in used:
-                        continue
-                    if abs(other.top - obj.top) <= TOLERANCE:
-                        row.append(other)
-                        used.add(other.handle)
                 if len(row) > 1:
                     rows.append(row)
+                row = [obj]
+                anchor = obj.top
+            if len(row) > 1:
+                rows.append(row)
 
             for row in rows:
                 tops = [o.top for o in row]
-                if len(set(tops)) <= 1:
+                top_counts = {}
+                for t in tops:
+                    top_counts[t] = top_counts.get(t, 0) + 1
+                if len(top_counts) <= 1:
                     continue
 
-                top_counts = Counter(tops)
-                target_top = top_counts.most_common(1)[0][0]
-                if top_counts.most_common(1)[0][1] == 1:
+                # Most common top (first seen wins a tie); without a
+                # repeated top, fall back to the mean
+                target_top, best = tops[0], 0
+                for t, n in top_counts.items():
+                    if n > best:
+                        target_top, best = t, n
+                if best == 1:
                     target_top = round(sum(tops) / len(tops))
 
                 for obj in row:
                     if obj.top != target_top:
                         delta = target_top - obj.top
                         new_bottom = obj.bottom + delta
-                        label = section_label(code)
                         try:
                             rpt.move_object(
                                 obj.handle,
                                 obj.left, target_top,
                                 obj.right, new_bottom,
                                 section_code=code,
+                                obj_type=obj.object_type_code,
                             )
                             fixes.append(
                                 f"  {label:8s} {obj.name:35s} "
@@ -100,8 +142,9 @@ with CrystalReport(INPUT) as rpt:
                                 f"SKIP ({e})"
                             )
 
-    for f in fixes:
-        print(f)
+    if not QUIET:
+        for f in fixes:
+            print(f)
     print(f"\n  {len(fixes)} objecten verwerkt")
 
     # =========================================================
@@ -114,32 +157,14 @@ with CrystalReport(INPUT) as rpt:
     TARGET_LEFT = 129
     TARGET_RIGHT = 10170
 
-    for code in sorted(sections.keys()):
-        objects = sections[code]
-        label = section_label(code)
-        boxes = sorted(
-            [o for o in objects if o.object_type == "Box"],
-            key=lambda o: o.top,
-        )
-        if len(boxes) < 2:
+    for code in section_codes:
+        label = labels[code]
+        kind, kopje, inner, content = classify_boxes(
+            by_type[code].get("Box", ()))
+        if kind == "layered":
+            box_fixes.append(f"  {label:8s} SKIP layered boxes")
             continue
-
-        # Identify kopje box (top, usually B~298) and content box
-        if len(boxes) == 3:
-            # GH#1 pattern: 2 nested boxes at top + content below
-            # Use the outermost kopje box (largest height of top two)
-            top_two = boxes[:2]
-            kopje = max(top_two, key=lambda b: b.bottom - b.top)
-            inner = min(top_two, key=lambda b: b.bottom - b.top)
-            content = boxes[2]
-        elif len(boxes) == 2:
-            kopje, content = boxes[0], boxes[1]
-            inner = None
-            # Skip layered boxes (content starts above kopje bottom)
-            if content.top < kopje.top:
-                box_fixes.append(f"  {label:8s} SKIP layered boxes")
-                continue
-        else:
+        if kind is None:
             continue
 
         # Fix content box top = kopje box bottom (no gap, no overlap)
@@ -147,8 +172,6 @@ with CrystalReport(INPUT) as rpt:
         need_fix_top = gap != 0
         need_fix_lr = (content.left != TARGET_LEFT
                        or content.right != TARGET_RIGHT)
-        need_fix_kopje_lr = (kopje.left != TARGET_LEFT
-                             or kopje.right != TARGET_RIGHT)
 
         if need_fix_top or need_fix_lr:
             new_top = kopje.bottom
@@ -159,12 +182,15 @@ with CrystalReport(INPUT) as rpt:
                     TARGET_LEFT, new_top,
                     TARGET_RIGHT, new_top + height,
                     section_code=code,
+                    obj_type=content.object_type_code,
                 )
+                # Read back the right edge the engine actually applied
+                right = rpt.get_object(content.handle, code).right
                 parts = []
                 if need_fix_top:
                     parts.append(f"top {content.top}->{new_top} (gap {gap:+d})")
                 if need_fix_lr:
-                    parts.append(f"L/R->{TARGET_LEFT}/{TARGET_RIGHT}")
+                    parts.append(f"L/R->{TARGET_LEFT}/{right}")
                 box_fixes.append(
                     f"  {label:8s} {content.name:10s} {', '.join(parts)}"
                 )
@@ -181,6 +207,7 @@ with CrystalReport(INPUT) as rpt:
                     TARGET_LEFT, kopje.top,
                     TARGET_RIGHT, kopje.bottom,
                     section_code=code,
+                    obj_type=kopje.object_type_code,
                 )
                 box_fixes.append(
                     f"  {label:8s} {kopje.name:10s} L/R->{TARGET_LEFT}/{TARGET_RIGHT}"
@@ -203,6 +230,7 @@ with CrystalReport(INPUT) as rpt:
                         TARGET_LEFT, inner.top,
                         TARGET_RIGHT, inner_target_bottom,
                         section_code=code,
+                        obj_type=inner.object_type_code,
                     )
                     parts = [f"L/R->{TARGET_LEFT}/{TARGET_RIGHT}"]
                     if inner.bottom != inner_target_bottom:
@@ -215,8 +243,9 @@ with CrystalReport(INPUT) as rpt:
                     box_fixes.append(
                         f"  {label:8s} {inner.name:10s} SKIP ({e})")
 
-    for f in box_fixes:
-        print(f)
+    if not QUIET:
+        for f in box_fixes:
+            print(f)
     print(f"\n  {len(box_fixes)} box-fixes verwerkt")
 
     # =========================================================
@@ -225,18 +254,16 @@ with CrystalReport(INPUT) as rpt:
     print("\n=== PASS 2: Kopjes -> Calibri 9 ===\n")
 
     kopje_fixes = []
-    for code in sorted(sections.keys()):
-        objects = sections[code]
-        label = section_label(code)
-        texts = [o for o in objects if o.object_type == "Text"]
+    set_calibri_9 = rpt.make_font_applier(face_name="Calibri", point_size=9)
+    for code in section_codes:
+        label = labels[code]
+        texts = by_type[code].get("Text", ())
         if not texts:
             continue
 
         # scope=2 sets ALL Text objects in the section
         try:
-            rpt.set_section_font(
-                code, face_name="Calibri", point_size=9, scope=2,
-            )
+            set_calibri_9(code, scope=2)
             names = [t.name for t in texts]
             kopje_fixes.append(
                 f"  {label:8s} Calibri 9 -> {', '.join(names)}"
@@ -244,8 +271,9 @@ with CrystalReport(INPUT) as rpt:
         except Exception as e:
             kopje_fixes.append(f"  {label:8s} SKIP ({e})")
 
-    for f in kopje_fixes:
-        print(f)
+    if not QUIET:
+        for f in kopje_fixes:
+            print(f)
     print(f"\n  {len(kopje_fixes)} secties verwerkt")
 
     # =========================================================
@@ -254,18 +282,16 @@ with CrystalReport(INPUT) as rpt:
     print("\n=== PASS 3: Data fields -> Arial 8 ===\n")
 
     field_fixes = []
-    for code in sorted(sections.keys()):
-        objects = sections[code]
-        label = section_label(code)
-        fields = [o for o in objects if o.object_type == "Field"]
+    set_arial_8 = rpt.make_font_applier(face_name="Arial", point_size=8)
+    for code in section_codes:
+        label = labels[code]
+        fields = by_type[code].get("Field", ())
         if not fields:
             continue
 
         # scope=1 sets ALL Field objects in the section
         try:
-            rpt.set_section_font(
-                code, face_name="Arial", point_size=8, scope=1,
-            )
+            set_arial_8(code, scope=1)
             names = [f.name for f in fields]
             field_fixes.append(
                 f"  {label:8s} Arial 8  -> {', '.join(names)}"
@@ -273,8 +299,9 @@ with CrystalReport(INPUT) as rpt:
         except Exception as e:
             field_fixes.append(f"  {label:8s} SKIP ({e})")
 
-    for f in field_fixes:
-        print(f)
+    if not QUIET:
+        for f in field_fixes:
+            print(f)
     print(f"\n  {len(field_fixes)} secties verwerkt")
 
     # =========================================================
@@ -287,17 +314,17 @@ with CrystalReport(INPUT) as rpt:
     pf_fixes = []
     pf_code = 42000
     if pf_code in sections:
-        for obj in sections[pf_code]:
-            if obj.object_type == "Field":
-                try:
-                    rpt.set_field_font(obj.handle, face_name="Arial",
-                                       point_size=8)
-                    pf_fixes.append(f"  PF#0     Arial 8  -> {obj.name}")
-                except Exception as e:
-                    pf_fixes.append(f"  PF#0     {obj.name} SKIP ({e})")
+        for obj in by_type[pf_code].get("Field", ()):
+            try:
+                rpt.set_field_font(obj.handle, face_name="Arial",
+                                   point_size=8)
+                pf_fixes.append(f"  PF#0     Arial 8  -> {obj.name}")
+            except Exception as e:
+                pf_fixes.append(f"  PF#0     {obj.name} SKIP ({e})")
 
-    for f in pf_fixes:
-        print(f)
+    if not QUIET:
+        for f in pf_fixes:
+            print(f)
     print(f"\n  {len(pf_fixes)} objecten verwerkt")
 
     # =========================================================
@@ -307,9 +334,8 @@ with CrystalReport(INPUT) as rpt:
     rpt.save(TEMP)
     print("Done!")
 
-# Move temp to final output
+# Move temp to final output; TEMP sits next to OUTPUT, so this is an
+# atomic rename that also replaces an existing OUTPUT
 if os.path.exists(TEMP):
-    if os.path.exists(OUTPUT):
-        os.remove(OUTPUT)
-    os.rename(TEMP, OUTPUT)
+    os.replace(TEMP, OUTPUT)
     print(f"Output: {OUTPUT} ({os.path.getsize(OUTPUT):,} bytes)")
@@ -4,6 +4,8 @@ These tests require Crystal Reports to be installed (crpe32.dll available).
 They are automatically skipped if the SDK is not found.
 """
 
+import shutil
+
 import pytest
 from pathlib import Path
 
@@ -27,6 +29,35 @@ def engine():
     eng.close()
 
 
+@pytest.fixture(scope="session")
+def sample_copy_source(tmp_path_factory):
+    """One local copy of SAMPLE_RPT that per-test copies are made from."""
+    source = tmp_path_factory.mktemp("base") / "sample.rpt"
+    shutil.copyfile(SAMPLE_RPT, source)
+    return source
+
+
+@pytest.fixture
+def rpt_copy(sample_copy_source, tmp_path):
+    """A private, writable copy of the sample report."""
+    copy = tmp_path / "sample.rpt"
+    shutil.copyfile(sample_copy_source, copy)
+    return copy
+
+
+@pytest.fixture(scope="module")
+def read_job(engine):
+    """Shared job for tests that only read from the report."""
+    j = engine.open(SAMPLE_RPT)
+    yield j
+    j.close()
+
+
+@pytest.fixture(scope="module")
+def all_objects(read_job):
+    return read_job.get_all_objects()
+
+
 @pytest.fixture
 def job(engine):
     j = engine.open(SAMPLE_RPT)
@@ -45,91 +76,138 @@ class TestEngine:
 
 
 class TestTables:
-    def test_get_tables(self, job):
-        tables = job.get_tables()
+    def test_get_tables(self, read_job):
+        tables = read_job.get_tables()
         assert isinstance(tables, list)
         assert len(tables) > 0
 
-    def test_tables_are_table_info(self, job):
-        for t in job.get_tables():
+    def test_tables_are_table_info(self, read_job):
+        for t in read_job.get_tables():
             assert isinstance(t, TableInfo)
 
 
 class TestFormulas:
-    def test_get_formulas(self, job):
-        formulas = job.get_formulas()
+    def test_get_formulas(self, read_job):
+        formulas = read_job.get_formulas()
         assert isinstance(formulas, list)
         assert len(formulas) > 0
 
-    def test_formulas_are_formula_info(self, job):
-        for f in job.get_formulas():
+    def test_formulas_are_formula_info(self, read_job):
+        for f in read_job.get_formulas():
             assert isinstance(f, FormulaInfo)
 
 
 class TestSQL:
-    def test_get_sql_query(self, job):
-        sql = job.get_sql_query()
+    def test_get_sql_query(self, read_job):
+        sql = read_job.get_sql_query()
         assert isinstance(sql, str)
 
 
 class TestSections:
-    def test_get_sections(self, job):
-        sections = job.get_sections()
+    def test_get_sections(self, read_job):
+        sections = read_job.get_sections()
         assert isinstance(sections, list)
         assert len(sections) > 0
 
 
 class TestParameters:
-    def test_get_parameters(self, job):
-        params = job.get_parameters()
+    def test_get_parameters(self, read_job):
+        params = read_job.get_parameters()
         assert isinstance(params, list)
 
 
 class TestSortFields:
-    def test_get_sort_fields(self, job):
-        fields = job.get_sort_fields()
+    def test_get_sort_fields(self, read_job):
+        fields = read_job.get_sort_fields()
         assert isinstance(fields, list)
 
 
+class TestSchema:
+    def test_schema_matches_getters(self, read_job):
+        schema = read_job.get_schema()
+        assert schema.n_parameters == len(read_job.get_parameters())
+        assert schema.n_sort_fields == len(read_job.get_sort_fields())
+        assert schema.n_groups == read_job.get_n_groups()
+
+
 class TestSectionCodes:
-    def test_get_section_codes(self, job):
-        codes = job.get_section_codes()
+    def test_get_section_codes(self, read_job):
+        codes = read_job.get_section_codes()
         assert isinstance(codes, list)
         assert len(codes) > 0
 
-    def test_section_codes_are_valid(self, job):
-        codes = job.get_section_codes()
+    def test_section_codes_are_valid(self, read_job):
+        codes = read_job.get_section_codes()
         for c in codes:
             assert c > 0
             assert c % 50 == 0 or c % 6000 == 0
 
+    def test_section_codes_cached(self, read_job):
+        codes = read_job.get_section_codes()
+        codes.append(-1)  # the cache must not be affected
+        assert read_job.get_section_codes() == codes[:-1]
+        read_job.invalidate_sections()
+        assert read_job.get_section_codes() == codes[:-1]
+
 
 class TestObjects:
-    def test_get_all_objects(self, job):
-        objects = job.get_all_objects()
-        assert isinstance(objects, list)
-        assert len(objects) > 0
+    def test_get_all_objects(self, all_objects):
+        assert isinstance(all_objects, list)
+        assert len(all_objects) > 0
 
-    def test_objects_are_report_object(self, job):
-        for obj in job.get_all_objects():
+    def test_objects_are_report_object(self, all_objects):
+        for obj in all_objects:
             assert isinstance(obj, ReportObject)
 
-    def test_objects_have_names(self, job):
-        objects = job.get_all_objects()
-        named = [o for o in objects if o.name]
+    def test_objects_have_names(self, all_objects):
+        named = [o for o in all_objects if o.name]
         assert len(named) > 0
 
-    def test_objects_have_types(self, job):
-        objects = job.get_all_objects()
-        types_found = {o.object_type for o in objects}
+    def test_objects_have_types(self, all_objects):
+        types_found = {o.object_type for o in all_objects}
         assert len(types_found) > 1  # should have at least Text and Field
 
-    def test_objects_in_section(self, job):
-        codes = job.get_section_codes()
+    def test_objects_have_type_codes(self, all_objects):
+        for obj in all_objects:
+            if obj.object_type == "Box":
+                assert obj.object_type_code == 4
+            elif obj.object_type == "Field":
+                assert obj.object_type_code == 1
+
+    def test_objects_soa_rows_match_get_all_objects(self, read_job):
+        soa = read_job.get_objects_soa()
+        assert (list(map(ReportObject, *soa.values()))
+                == read_job.get_all_objects())
+
+    def test_iter_objects_matches_lists(self, read_job):
+        assert list(read_job.iter_objects()) == read_job.get_all_objects()
+        code = read_job.get_section_codes()[0]
+        assert (list(read_job.iter_objects(code))
+                == read_job.get_objects_in_section(code))
+
+    def test_all_objects_cached_until_move(self, job):
+        objects = job.get_all_objects()
+        objects[0].left = -1  # the cache must not be affected
+        assert job.get_all_objects() == job.get_all_objects()
+        assert job.get_all_objects()[0].left != -1
+        obj = job.get_all_objects()[0]
+        job.move_object(obj.handle, obj.left + 100, obj.top,
+                        obj.right + 100, obj.bottom,
+                        section_code=obj.section_code)
+        assert job.get_all_objects()[0].left == obj.left + 100
+
+    def test_get_object_matches_listing(self, read_job, all_objects):
+        if not all_objects:
+            pytest.skip("No objects found")
+        obj = all_objects[0]
+        assert read_job.get_object(obj.handle, obj.section_code) == obj
+
+    def test_objects_in_section(self, read_job):
+        codes = read_job.get_section_codes()
         # Page Header (area 2) should have objects
         page_header = [c for c in codes if 12000 <= c < 18000]
         if page_header:
-            objects = job.get_objects_in_section(page_header[0])
+            objects = read_job.get_objects_in_section(page_header[0])
             assert isinstance(objects, list)
 
 
@@ -202,6 +280,22 @@ class TestMoveBox:
                         orig_right, obj.bottom,
                         section_code=obj.section_code)
 
+    def test_move_box_with_known_type(self, job):
+        obj = self._first_box(job)
+        orig_left, orig_right = obj.left, obj.right
+        job.move_object(obj.handle, obj.left + 100, obj.top,
+                        obj.right + 100, obj.bottom,
+                        section_code=obj.section_code,
+                        obj_type=obj.object_type_code)
+        objects = job.get_objects_in_section(obj.section_code)
+        moved = [o for o in objects if o.handle == obj.handle][0]
+        assert moved.left == orig_left + 100
+        # Restore
+        job.move_object(obj.handle, orig_left, obj.top,
+                        orig_right, obj.bottom,
+                        section_code=obj.section_code,
+                        obj_type=obj.object_type_code)
+
     def test_move_box_vertical(self, job):
         obj = self._first_box(job)
         orig_top, orig_bottom = obj.top, obj.bottom
@@ -253,6 +347,21 @@ class TestMoveLine:
                         obj.right, obj.bottom,
                         section_code=obj.section_code)
 
+    def test_move_object_batch(self, job):
+        obj = self._first_line(job)
+        code = obj.section_code
+        job.move_object_batch([
+            (obj.handle, obj.left + 100, obj.top, obj.right + 100,
+             obj.bottom, code, obj.object_type_code),
+        ])
+        objects = job.get_objects_in_section(code)
+        moved = [o for o in objects if o.handle == obj.handle][0]
+        assert moved.left == obj.left + 100
+        # Restore
+        job.move_object_batch([
+            (obj.handle, obj.left, obj.top, obj.right, obj.bottom, code),
+        ])
+
 
 class TestSetFieldFont:
     def _first_field(self, job):
@@ -266,6 +375,14 @@ class TestSetFieldFont:
         # Should not raise
         job.set_field_font(obj.handle, face_name="Arial", point_size=10)
 
+    def test_set_field_font_batch(self, job):
+        handles = [o.handle for o in job.get_all_objects()
+                   if o.object_type == "Field"][:3]
+        if not handles:
+            pytest.skip("No Field objects found")
+        # Should not raise
+        job.set_field_font_batch(handles, face_name="Arial", point_size=10)
+
     def test_set_field_font_bold(self, job):
         obj = self._first_field(job)
         job.set_field_font(obj.handle, bold=True)
@@ -284,6 +401,22 @@ class TestSetSectionFont:
             pytest.skip("No Page Header section")
         job.set_section_font(ph[0], face_name="Arial", point_size=10, scope=1)
 
+    def test_set_section_font_batch(self, job):
+        codes = job.get_section_codes()
+        ph = [c for c in codes if 12000 <= c < 18000]
+        if not ph:
+            pytest.skip("No Page Header section")
+        job.set_section_font_batch(ph, face_name="Arial", point_size=10,
+                                   scope=1)
+
+    def test_make_font_applier(self, job):
+        codes = job.get_section_codes()
+        ph = [c for c in codes if 12000 <= c < 18000]
+        if not ph:
+            pytest.skip("No Page Header section")
+        apply = job.make_font_applier(face_name="Arial", point_size=10)
+        apply(ph[0], scope=1)
+
     def test_set_section_font_scope_both(self, job):
         codes = job.get_section_codes()
         ph = [c for c in codes if 12000 <= c < 18000]
@@ -318,12 +451,12 @@ class TestSetObjectFontColor:
 
 
 class TestSectionHeight:
-    def test_get_section_height(self, job):
-        codes = job.get_section_codes()
+    def test_get_section_height(self, read_job):
+        codes = read_job.get_section_codes()
         ph = [c for c in codes if 12000 <= c < 18000]
         if not ph:
             pytest.skip("No Page Header section")
-        height = job.get_section_height(ph[0])
+        height = read_job.get_section_height(ph[0])
         assert height > 0
 
     def test_set_section_height(self, job):
@@ -340,8 +473,8 @@ class TestSectionHeight:
 
 
 class TestMargins:
-    def test_get_margins(self, job):
-        left, right, top, bottom = job.get_margins()
+    def test_get_margins(self, read_job):
+        left, right, top, bottom = read_job.get_margins()
         assert left >= 0
         assert right >= 0
         assert top >= 0
@@ -353,13 +486,9 @@ class TestMargins:
 
 
 class TestDeleteObject:
-    def test_delete_object(self, engine, tmp_path):
+    def test_delete_object(self, engine, rpt_copy):
         """Delete a text object from a copy of the report."""
-        import shutil
-        copy = tmp_path / "delete_test.rpt"
-        shutil.copy2(SAMPLE_RPT, copy)
-
-        j = engine.open(copy)
+        j = engine.open(rpt_copy)
         try:
             objects_before = j.get_all_objects()
             n_before = len(objects_before)
@@ -377,3 +506,14 @@ class TestDeleteObject:
             assert len(objects_after) == n_before - 1
         finally:
             j.close()
+
+
+class TestPrefetch:
+    def test_prefetch_matches_getters(self, job):
+        result = job.prefetch().result(timeout=60)
+        assert set(result) == {
+            "tables", "formulas", "sql_query",
+            "sections", "parameters", "sort_fields",
+        }
+        assert len(result["tables"]) == len(job.get_tables())
+        assert len(result["formulas"]) == len(job.get_formulas())
@@ -1,5 +1,7 @@
 """Tests for the pure-Python OLE layer."""
 
+import copy
+
 import pytest
 from pathlib import Path
 
@@ -51,16 +53,38 @@ class TestStreams:
         for s in parser.list_streams():
             assert isinstance(s, str)
 
+    def test_list_streams_is_stable(self, parser):
+        # The directory is listed once and reused by later calls
+        assert parser.list_streams() == parser.list_streams()
+        assert parser.get_report_info()["num_streams"] == len(parser.list_streams())
+
     def test_get_stream_returns_bytes(self, parser):
         streams = parser.list_streams()
         data = parser.get_stream(streams[0])
         assert isinstance(data, bytes)
 
+    def test_get_stream_view_matches_get_stream(self, parser):
+        path = parser.list_streams()[0]
+        view = parser.get_stream_view(path)
+        assert view.readonly
+        assert bytes(view) == parser.get_stream(path)
+
     def test_get_nonexistent_stream_raises(self, parser):
         with pytest.raises(OleParseError):
             parser.get_stream("nonexistent/stream")
 
 
+class TestFromBytes:
+    def test_matches_file(self, parser):
+        with OleParser.from_bytes(SAMPLE_RPT.read_bytes()) as p:
+            assert p.list_streams() == parser.list_streams()
+
+    def test_write_needs_output_path(self):
+        with OleParser.from_bytes(SAMPLE_RPT.read_bytes()) as p:
+            with pytest.raises(OleParseError):
+                p.set_stream(p.list_streams()[0], b"")
+
+
 class TestEmbeddedImages:
     def test_returns_list(self, parser):
         images = parser.get_embedded_images()
@@ -73,6 +97,21 @@ class TestEmbeddedImages:
             assert isinstance(img.data, bytes)
             assert img.size > 0
 
+    def test_unread_image_data_after_close_raises(self):
+        parser = OleParser(SAMPLE_RPT)
+        images = parser.get_embedded_images()
+        parser.close()
+        for img in images:
+            with pytest.raises(OleParseError):
+                img.data
+
+    def test_copied_image_keeps_data_after_close(self):
+        parser = OleParser(SAMPLE_RPT)
+        copies = [copy.copy(img) for img in parser.get_embedded_images()]
+        parser.close()
+        for img in copies:
+            assert len(img.data) == img.size
+
 
 class TestSubreports:
     def test_returns_list(self, parser):
@@ -97,3 +136,63 @@ class TestReportInfo:
         assert "streams" in result
         assert "embedded_images" in result
         assert "subreports" in result
+
+
+class TestFastClone:
+    def test_copies_content(self, tmp_path):
+        from crystalreports.ole_parser import _fast_clone
+        src = tmp_path / "src.bin"
+        src.write_bytes(bytes(range(256)) * 300)
+        dst = tmp_path / "dst.bin"
+        _fast_clone(src, dst)
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_same_file_is_refused(self, tmp_path, monkeypatch):
+        import shutil
+        from crystalreports.ole_parser import _fast_clone
+        src = tmp_path / "src.bin"
+        data = bytes(range(256)) * 300
+        src.write_bytes(data)
+        monkeypatch.chdir(tmp_path)
+        with pytest.raises(shutil.SameFileError):
+            _fast_clone(src, Path("src.bin"))
+        assert src.read_bytes() == data
+
+
+class TestSectorRuns:
+    @staticmethod
+    def _runs(fat, start, size, sector_size=512):
+        from crystalreports.ole_parser import _sector_runs
+        file_size = sector_size * (len(fat) + 1)
+        return _sector_runs(fat, sector_size, file_size, start, size)
+
+    def test_merges_consecutive_sectors(self):
+        assert self._runs([1, 2, 0xFFFFFFFE], 0, 1536) == [(512, 1536)]
+
+    def test_chain_past_fat_end_is_none(self):
+        # The last FAT entry points one past the end of the table
+        assert self._runs([1, 2, 3], 0, 4096) is None
+
+    def test_missing_olefile_internals_fall_back(self):
+        from types import SimpleNamespace
+        parser = SimpleNamespace(_ole=SimpleNamespace())
+        assert OleParser._stream_runs(parser, ["Contents"]) is None
+
+
+class TestDecode:
+    def test_ascii(self):
+        from crystalreports.ole_parser import _decode
+        assert _decode(b"SafiPrint") == "SafiPrint"
+
+    def test_empty_is_none(self):
+        from crystalreports.ole_parser import _decode
+        assert _decode(b"") is None
+        assert _decode(None) is None
+
+    def test_utf8(self):
+        from crystalreports.ole_parser import _decode
+        assert _decode("café".encode("utf-8")) == "café"
+
+    def test_cp1252_fallback(self):
+        from crystalreports.ole_parser import _decode
+        assert _decode(b"\x80 caf\xe9") == "€ café"
@@ -0,0 +1,61 @@
+"""Tests for the opt-in call profiler."""
+
+import json
+
+import pytest
+
+from crystalreports import profiling
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    """Turn profiling on for one test and start from empty stats."""
+    monkeypatch.setattr(profiling, "ENABLED", True)
+    profiling.reset_stats()
+    yield
+    profiling.reset_stats()
+
+
+def _add(a, b):
+    return a + b
+
+
+class TestProfileFunction:
+    def test_disabled_returns_function_unchanged(self, monkeypatch):
+        monkeypatch.setattr(profiling, "ENABLED", False)
+        assert profiling.profile_function(_add) is _add
+
+    def test_counts_calls(self, enabled):
+        wrapped = profiling.profile_function(_add, "PEAdd")
+        assert wrapped(1, 2) == 3
+        assert wrapped(3, 4) == 7
+        stats = profiling.get_stats()
+        assert stats["PEAdd"]["calls"] == 2
+        assert stats["PEAdd"]["total"] >= 0
+
+    def test_default_name(self, enabled):
+        profiling.profile_function(_add)(1, 1)
+        assert "_add" in profiling.get_stats()
+
+    def test_records_failing_calls(self, enabled):
+        def fail():
+            raise ValueError("boom")
+
+        wrapped = profiling.profile_function(fail)
+        with pytest.raises(ValueError):
+            wrapped()
+        assert profiling.get_stats()["fail"]["calls"] == 1
+
+    def test_reset_stats(self, enabled):
+        profiling.profile_function(_add)(1, 1)
+        profiling.reset_stats()
+        assert profiling.get_stats() == {}
+
+
+class TestWriteReport:
+    def test_write_report_json(self, enabled, tmp_path):
+        profiling.profile_function(_add, "PEAdd")(1, 2)
+        out = tmp_path / "profile.json"
+        profiling.write_report(out)
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert data["PEAdd"]["calls"] == 1
@@ -55,6 +55,13 @@ class TestOleLayer:
         with CrystalReport(SAMPLE_RPT, use_sdk=False) as rpt:
             assert rpt.metadata is not None
 
+    def test_ole_access_after_close_raises(self):
+        from crystalreports.exceptions import ReportOpenError
+        rpt = CrystalReport(SAMPLE_RPT, use_sdk=False)
+        rpt.close()
+        with pytest.raises(ReportOpenError):
+            _ = rpt.streams
+
 
 class TestSDKLayer:
     """Tests that require crpe32.dll."""
@@ -80,9 +87,48 @@ class TestSDKLayer:
         with pytest.raises(SDKNotAvailableError):
             _ = ole_only_report.sql_query
 
+    def test_load_all_require_sdk(self, ole_only_report):
+        from crystalreports.exceptions import SDKNotAvailableError
+        with pytest.raises(SDKNotAvailableError):
+            ole_only_report.load_all()
+
+    def test_load_all_fills_properties(self, report, monkeypatch):
+        if not report.has_sdk:
+            pytest.skip("crpe32.dll not available")
+        from crystalreports.crpe_engine import CrpeJob
+        calls = []
+        get_tables = CrpeJob.get_tables
+
+        def counting_get_tables(job):
+            calls.append(job)
+            return get_tables(job)
+
+        monkeypatch.setattr(CrpeJob, "get_tables", counting_get_tables)
+        report.load_all(include=("tables", "n_groups"))
+        assert len(calls) == 1
+        report.tables
+        assert len(calls) == 1
+
+    def test_objects_by_section_matches_engine(self, report):
+        if not report.has_sdk:
+            pytest.skip("crpe32.dll not available")
+        for code in report.section_codes:
+            # iter_objects() with a section reads straight from the engine
+            assert (report.get_objects_in_section(code)
+                    == list(report.iter_objects(code)))
+
 
 class TestSaveMetadata:
     def test_set_metadata_creates_copy(self, ole_only_report, tmp_path):
         dest = tmp_path / "copy.rpt"
         ole_only_report.set_metadata(output_path=dest, title="Test Title")
         assert dest.exists()
+
+
+class TestPreflight:
+    def test_rejects_non_ole_file(self, tmp_path):
+        from crystalreports.exceptions import ReportOpenError
+        bogus = tmp_path / "bogus.rpt"
+        bogus.write_bytes(b"not a report" * 100)
+        with pytest.raises(ReportOpenError):
+            CrystalReport(bogus, use_sdk=False)